@@ -3,9 +3,64 @@
 """
 
 import matplotlib.pyplot as plt
+from matplotlib.ticker import LogLocator
 import numpy as np
 import os
 
+try:
+    from numba import njit
+except ImportError:
+    # numba не обязательна: без неё функции выполняются интерпретатором
+    def njit(*args, **kwargs):
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda func: func
+
+
+# Соединители и отступы для текстового вывода дерева
+_BRANCH_LAST = "└── "
+_BRANCH_MID = "├── "
+_INDENT_LAST = "    "
+_INDENT_MID = "│   "
+
+
+@njit(cache=True)
+def _compute_tree_order(n):
+    """
+    Вычисление прямого порядка обхода (корень, левый, правый) кучи из n узлов.
+    
+    Обход выполняется по явному стеку индексов, поэтому при наличии numba
+    вся индексная арифметика компилируется в машинный код.
+    
+    Args:
+        n: Количество элементов кучи
+        
+    Returns:
+        Массив индексов узлов в порядке вывода
+    """
+    order = np.empty(n, dtype=np.int64)
+    stack = np.empty(max(n, 1), dtype=np.int64)
+    top = 0
+    count = 0
+    if n > 0:
+        stack[0] = 0
+        top = 1
+    while top > 0:
+        top -= 1
+        index = stack[top]
+        order[count] = index
+        count += 1
+        
+        right = 2 * index + 2
+        left = 2 * index + 1
+        if right < n:
+            stack[top] = right
+            top += 1
+        if left < n:
+            stack[top] = left
+            top += 1
+    return order
+
 
 def visualize_heap_tree(heap, title="Heap Tree", save_path=None):
     """
@@ -20,186 +75,346 @@ def visualize_heap_tree(heap, title="Heap Tree", save_path=None):
         print(f"{title}: Empty heap")
         return
     
-    def print_tree(index, prefix="", is_last=True):
-        """Рекурсивный вывод дерева."""
-        if index >= len(heap.heap):
-            return
-        
-        print(prefix + ("└── " if is_last else "├── ") + str(heap.heap[index]))
-        
-        left = 2 * index + 1
-        right = 2 * index + 2
-        
-        if left < len(heap.heap) or right < len(heap.heap):
-            new_prefix = prefix + ("    " if is_last else "│   ")
-            if right < len(heap.heap):
-                print_tree(left, new_prefix, False)
-                print_tree(right, new_prefix, True)
-            elif left < len(heap.heap):
-                print_tree(left, new_prefix, True)
+    arr = heap.heap
+    n = len(arr)
+    order = _compute_tree_order(n)
     
     print(f"\n{title}:")
-    print_tree(0)
+    # prefixes[d] - готовый отступ для узла глубины d на текущем пути обхода.
+    # В прямом порядке обхода предки узла глубины d занимают ровно первые
+    # d + 1 элементов, поэтому стек усекается по глубине без рекурсии
+    prefixes = [""]
+    for index in order:
+        index = int(index)
+        depth = (index + 1).bit_length() - 1
+        del prefixes[depth + 1:]
+        prefix = prefixes[depth]
+        
+        # Узел последний среди братьев, если он правый потомок
+        # или левый потомок без правого брата
+        is_last = index % 2 == 0 or index + 1 >= n
+        print(f"{prefix}{_BRANCH_LAST if is_last else _BRANCH_MID}{arr[index]}")
+        if 2 * index + 1 < n:
+            prefixes.append(prefix + (_INDENT_LAST if is_last else _INDENT_MID))
     print()
 
 
-def plot_performance_comparison(results, save_path=None):
+# Кэш фигур между вызовами: вид графика -> (fig, axes, линии по ключу серии).
+# Повторные вызовы (например, при переборе параметров) обновляют данные
+# существующих линий вместо построения фигуры с нуля.
+_fig_cache = {}
+
+
+def _setup_log_axis(ax):
+    """Настройка логарифмических шкал и локаторов делений оси."""
+    ax.set_xscale('log')
+    ax.set_yscale('log')
+    ax.xaxis.set_major_locator(LogLocator(base=10, numticks=10))
+    ax.yaxis.set_major_locator(LogLocator(base=10, numticks=10))
+
+
+def _clear_axis(ax, lines, prefix):
+    """
+    Очищает ось, которую текущий вызов не заполняет.
+    
+    Заголовок, подписи, легенда и линии прошлого вызова удаляются, чтобы
+    на сохраненном графике осталась пустая ось, как у новой фигуры. Линии
+    этой оси удаляются и из словаря lines, а логарифмические шкалы
+    настраиваются заново.
+    
+    Args:
+        ax: Ось для очистки
+        lines: Словарь уже созданных линий фигуры
+        prefix: Префикс ключей линий этой оси в словаре lines
+    """
+    ax.cla()
+    # cla не сбрасывает накопленные пределы данных: без relim пустая ось
+    # сохранила бы масштаб линий прошлого вызова
+    ax.relim()
+    _setup_log_axis(ax)
+    for key in [key for key in lines if key.startswith(f'{prefix}_')]:
+        del lines[key]
+
+
+def _get_figure(kind, nrows, ncols, figsize):
+    """
+    Возвращает закэшированную фигуру заданного вида или создает новую.
+    
+    Фигура пересоздается, если её окно было закрыто. Линии закэшированной
+    фигуры скрываются и снова показываются при обновлении их данных, а оси,
+    которые новый вызов не заполняет, очищаются через _clear_axis, чтобы
+    данные прошлого вызова не оставались на графике.
+    """
+    cached = _fig_cache.get(kind)
+    if cached is None or not plt.fignum_exists(cached[0].number):
+        fig, axes = plt.subplots(nrows, ncols, figsize=figsize)
+        # Логарифмические шкалы и локаторы настраиваются один раз при создании
+        # фигуры; линии затем строятся через ax.plot без повторной настройки
+        # шкал, которую выполняет каждый вызов loglog
+        for ax in np.ravel(axes):
+            _setup_log_axis(ax)
+        cached = (fig, axes, {})
+        _fig_cache[kind] = cached
+    else:
+        for line in cached[2].values():
+            line.set_visible(False)
+    return cached
+
+
+def _set_line(ax, lines, key, x, y, fmt, **kwargs):
+    """
+    Обновляет данные линии через set_data или создает её при первом вызове.
+    
+    Args:
+        ax: Ось для построения
+        lines: Словарь уже созданных линий фигуры
+        key: Ключ серии в словаре lines
+        x, y: Данные серии
+        fmt: Формат линии
+        **kwargs: Параметры, передаваемые в plot при создании линии
+    """
+    line = lines.get(key)
+    if line is None:
+        line, = ax.plot(x, y, fmt, **kwargs)
+        lines[key] = line
+    else:
+        line.set_data(x, y)
+        line.set_visible(True)
+    return line
+
+
+# Директории, уже созданные при сохранении графиков.
+_ensured_dirs = set()
+
+
+def _ensure_dir(save_path):
+    """Создает директорию для save_path, если она еще не создавалась."""
+    directory = os.path.dirname(save_path)
+    if directory and directory not in _ensured_dirs:
+        os.makedirs(directory, exist_ok=True)
+        _ensured_dirs.add(directory)
+
+
+def _save_figure(fig, save_path):
+    """
+    Сохраняет фигуру в save_path, создавая директорию при необходимости.
+    
+    Если директория была удалена после того, как попала в кэш
+    _ensured_dirs, запись из кэша удаляется, директория создается заново
+    и сохранение повторяется.
+    """
+    _ensure_dir(save_path)
+    try:
+        fig.savefig(save_path, dpi=300, bbox_inches='tight')
+    except FileNotFoundError:
+        _ensured_dirs.discard(os.path.dirname(save_path))
+        _ensure_dir(save_path)
+        fig.savefig(save_path, dpi=300, bbox_inches='tight')
+
+
+def _arr(d, k):
+    """
+    Приводит серию d[k] к np.ndarray (float64) один раз и сохраняет её в d.
+    
+    Повторные обращения к серии (в том числе внутри matplotlib) работают
+    с уже готовым массивом без повторного преобразования списка.
+    """
+    d[k] = np.asarray(d[k], dtype=np.float64)
+    return d[k]
+
+
+def _rescale(ax):
+    """Пересчитывает пределы оси по видимым линиям после обновления их данных."""
+    ax.relim(visible_only=True)
+    ax.autoscale_view()
+
+
+def _plot_sorting(ax, lines, prefix, sorting, title):
+    """
+    Построение графика сравнения алгоритмов сортировки на оси ax.
+    
+    Args:
+        ax: Ось для построения
+        lines: Словарь уже созданных линий фигуры
+        prefix: Префикс ключей линий этой оси в словаре lines
+        sorting: Результаты измерений сортировки (sizes, heapsort, quicksort, mergesort)
+        title: Заголовок графика
+    """
+    sizes = _arr(sorting, 'sizes')
+    
+    _set_line(ax, lines, f'{prefix}_heapsort', sizes, _arr(sorting, 'heapsort'), 'o-', label='Heapsort', linewidth=2)
+    _set_line(ax, lines, f'{prefix}_quicksort', sizes, _arr(sorting, 'quicksort'), 's-', label='Quicksort', linewidth=2)
+    _set_line(ax, lines, f'{prefix}_mergesort', sizes, _arr(sorting, 'mergesort'), '^-', label='Mergesort', linewidth=2)
+    _rescale(ax)
+    ax.set_xlabel('Размер массива (log)', fontsize=12)
+    ax.set_ylabel('Время (секунды, log)', fontsize=12)
+    ax.set_title(title, fontsize=14, fontweight='bold')
+    ax.legend()
+    ax.grid(True, alpha=0.3, which='both')
+
+
+def plot_performance_comparison(results, save_path=None, verbose=True):
     """
     Построение графиков сравнения производительности.
     
     Args:
         results: Словарь с результатами измерений
         save_path: Путь для сохранения графика
+        verbose: Выводить ли сообщение о сохранении графика
     """
-    fig, axes = plt.subplots(2, 2, figsize=(15, 12))
+    if not results.keys() & {'heap_build', 'sorting', 'heap_operations'}:
+        return
+    
+    fig, axes, lines = _get_figure('performance', 2, 2, figsize=(15, 12))
     
     # График 1: Построение кучи (логарифмический масштаб)
     ax1 = axes[0, 0]
     if 'heap_build' in results:
-        sizes = results['heap_build']['sizes']
-        sequential = results['heap_build']['sequential']
-        build_heap = results['heap_build']['build_heap']
+        sizes = _arr(results['heap_build'], 'sizes')
+        sequential = _arr(results['heap_build'], 'sequential')
+        build_heap = _arr(results['heap_build'], 'build_heap')
         
-        ax1.loglog(sizes, sequential, 'o-', label='Последовательная вставка', linewidth=2)
-        ax1.loglog(sizes, build_heap, 's-', label='build_heap', linewidth=2)
+        _set_line(ax1, lines, 'ax1_sequential', sizes, sequential, 'o-', label='Последовательная вставка', linewidth=2)
+        _set_line(ax1, lines, 'ax1_build_heap', sizes, build_heap, 's-', label='build_heap', linewidth=2)
+        _rescale(ax1)
         ax1.set_xlabel('Размер массива (log)', fontsize=12)
         ax1.set_ylabel('Время (секунды, log)', fontsize=12)
         ax1.set_title('Сравнение методов построения кучи', fontsize=14, fontweight='bold')
         ax1.legend()
         ax1.grid(True, alpha=0.3, which='both')
+    else:
+        _clear_axis(ax1, lines, 'ax1')
     
     # График 2: Сравнение алгоритмов сортировки (логарифмический масштаб)
     ax2 = axes[0, 1]
     if 'sorting' in results:
-        sizes = results['sorting']['sizes']
-        heapsort_times = results['sorting']['heapsort']
-        quicksort_times = results['sorting']['quicksort']
-        mergesort_times = results['sorting']['mergesort']
-        
-        ax2.loglog(sizes, heapsort_times, 'o-', label='Heapsort', linewidth=2)
-        ax2.loglog(sizes, quicksort_times, 's-', label='Quicksort', linewidth=2)
-        ax2.loglog(sizes, mergesort_times, '^-', label='Mergesort', linewidth=2)
-        ax2.set_xlabel('Размер массива (log)', fontsize=12)
-        ax2.set_ylabel('Время (секунды, log)', fontsize=12)
-        ax2.set_title('Сравнение алгоритмов сортировки', fontsize=14, fontweight='bold')
-        ax2.legend()
-        ax2.grid(True, alpha=0.3, which='both')
+        _plot_sorting(ax2, lines, 'ax2', results['sorting'], 'Сравнение алгоритмов сортировки')
+    else:
+        _clear_axis(ax2, lines, 'ax2')
     
     # График 3: Операции кучи (логарифмический масштаб)
     ax3 = axes[1, 0]
     if 'heap_operations' in results:
-        sizes = results['heap_operations']['sizes']
-        insert_times = results['heap_operations']['insert']
-        extract_times = results['heap_operations']['extract']
+        sizes = _arr(results['heap_operations'], 'sizes')
+        insert_times = _arr(results['heap_operations'], 'insert')
+        extract_times = _arr(results['heap_operations'], 'extract')
         
-        ax3.loglog(sizes, insert_times, 'o-', label='insert', linewidth=2)
-        ax3.loglog(sizes, extract_times, 's-', label='extract', linewidth=2)
+        _set_line(ax3, lines, 'ax3_insert', sizes, insert_times, 'o-', label='insert', linewidth=2)
+        _set_line(ax3, lines, 'ax3_extract', sizes, extract_times, 's-', label='extract', linewidth=2)
+        _rescale(ax3)
         ax3.set_xlabel('Размер кучи (log)', fontsize=12)
         ax3.set_ylabel('Время (секунды, log)', fontsize=12)
         ax3.set_title('Время операций insert и extract', fontsize=14, fontweight='bold')
         ax3.legend()
         ax3.grid(True, alpha=0.3, which='both')
+    else:
+        _clear_axis(ax3, lines, 'ax3')
     
     # График 4: Логарифмический масштаб для сортировки (дубликат для полноты)
     ax4 = axes[1, 1]
     if 'sorting' in results:
-        sizes = results['sorting']['sizes']
-        heapsort_times = results['sorting']['heapsort']
-        quicksort_times = results['sorting']['quicksort']
-        mergesort_times = results['sorting']['mergesort']
-        
-        ax4.loglog(sizes, heapsort_times, 'o-', label='Heapsort', linewidth=2)
-        ax4.loglog(sizes, quicksort_times, 's-', label='Quicksort', linewidth=2)
-        ax4.loglog(sizes, mergesort_times, '^-', label='Mergesort', linewidth=2)
-        ax4.set_xlabel('Размер массива (log)', fontsize=12)
-        ax4.set_ylabel('Время (секунды, log)', fontsize=12)
-        ax4.set_title('Сравнение алгоритмов (логарифмический масштаб)', fontsize=14, fontweight='bold')
-        ax4.legend()
-        ax4.grid(True, alpha=0.3, which='both')
+        _plot_sorting(ax4, lines, 'ax4', results['sorting'], 'Сравнение алгоритмов (логарифмический масштаб)')
+    else:
+        _clear_axis(ax4, lines, 'ax4')
     
-    plt.tight_layout()
+    fig.tight_layout()
     
     if save_path:
-        os.makedirs(os.path.dirname(save_path), exist_ok=True)
-        plt.savefig(save_path, dpi=300, bbox_inches='tight')
-        print(f"График сохранен: {save_path}")
+        _save_figure(fig, save_path)
+        if verbose:
+            print(f"График сохранен: {save_path}")
     
+    fig.canvas.draw_idle()
     plt.show()
-    plt.close()
 
 
-def plot_complexity_analysis(results, save_path=None):
+def plot_complexity_analysis(results, save_path=None, verbose=True):
     """
     Построение графика для анализа сложности.
     
     Args:
         results: Словарь с результатами измерений
         save_path: Путь для сохранения графика
+        verbose: Выводить ли сообщение о сохранении графика
     """
-    fig, axes = plt.subplots(1, 2, figsize=(15, 6))
+    if not results.keys() & {'heap_build', 'heap_operations'}:
+        return
+    
+    fig, axes, lines = _get_figure('complexity', 1, 2, figsize=(15, 6))
     
     # График 1: Теоретическая vs практическая сложность построения кучи (логарифмический масштаб)
     ax1 = axes[0]
     if 'heap_build' in results:
-        sizes = results['heap_build']['sizes']
-        sequential = results['heap_build']['sequential']
-        build_heap = results['heap_build']['build_heap']
+        sizes = _arr(results['heap_build'], 'sizes')
+        sequential = _arr(results['heap_build'], 'sequential')
+        build_heap = _arr(results['heap_build'], 'build_heap')
         
         # Теоретическая сложность: O(n log n) для последовательной вставки
         # и O(n) для build_heap
-        theoretical_sequential = [n * np.log2(n) if n > 0 else 0 for n in sizes]
-        theoretical_build = sizes
+        theoretical_sequential = np.asarray([n * np.log2(n) if n > 0 else 0 for n in sizes], dtype=np.float64)
+        theoretical_build = np.asarray(sizes, dtype=np.float64)
         
         # Нормализуем для сравнения
-        if max(sequential) > 0:
-            norm_seq = max(sequential) / max(theoretical_sequential) if max(theoretical_sequential) > 0 else 1
-            theoretical_sequential = [t * norm_seq for t in theoretical_sequential]
+        seq_max = sequential.max()
+        t_seq_max = theoretical_sequential.max()
+        if seq_max > 0:
+            norm_seq = seq_max / t_seq_max if t_seq_max > 0 else 1
+            theoretical_sequential = theoretical_sequential * norm_seq
         
-        if max(build_heap) > 0:
-            norm_build = max(build_heap) / max(theoretical_build) if max(theoretical_build) > 0 else 1
-            theoretical_build = [t * norm_build for t in theoretical_build]
+        build_max = build_heap.max()
+        t_build_max = theoretical_build.max()
+        if build_max > 0:
+            norm_build = build_max / t_build_max if t_build_max > 0 else 1
+            theoretical_build = theoretical_build * norm_build
         
-        ax1.loglog(sizes, sequential, 'o-', label='Последовательная вставка (практика)', linewidth=2)
-        ax1.loglog(sizes, theoretical_sequential, '--', label='O(n log n) (теория)', linewidth=2, alpha=0.7)
-        ax1.loglog(sizes, build_heap, 's-', label='build_heap (практика)', linewidth=2)
-        ax1.loglog(sizes, theoretical_build, '--', label='O(n) (теория)', linewidth=2, alpha=0.7)
+        _set_line(ax1, lines, 'ax1_sequential', sizes, sequential, 'o-', label='Последовательная вставка (практика)', linewidth=2)
+        _set_line(ax1, lines, 'ax1_theoretical_sequential', sizes, theoretical_sequential, '--', label='O(n log n) (теория)', linewidth=2, alpha=0.7)
+        _set_line(ax1, lines, 'ax1_build_heap', sizes, build_heap, 's-', label='build_heap (практика)', linewidth=2)
+        _set_line(ax1, lines, 'ax1_theoretical_build', sizes, theoretical_build, '--', label='O(n) (теория)', linewidth=2, alpha=0.7)
+        _rescale(ax1)
         ax1.set_xlabel('Размер массива (log)', fontsize=12)
         ax1.set_ylabel('Нормализованное время (log)', fontsize=12)
         ax1.set_title('Теоретическая vs практическая сложность', fontsize=14, fontweight='bold')
         ax1.legend()
         ax1.grid(True, alpha=0.3, which='both')
+    else:
+        _clear_axis(ax1, lines, 'ax1')
     
     # График 2: Анализ сложности операций (логарифмический масштаб)
     ax2 = axes[1]
     if 'heap_operations' in results:
-        sizes = results['heap_operations']['sizes']
-        insert_times = results['heap_operations']['insert']
-        extract_times = results['heap_operations']['extract']
+        sizes = _arr(results['heap_operations'], 'sizes')
+        insert_times = _arr(results['heap_operations'], 'insert')
+        extract_times = _arr(results['heap_operations'], 'extract')
         
         # Теоретическая сложность: O(log n)
-        theoretical_log = [np.log2(n) if n > 0 else 0 for n in sizes]
+        theoretical_log = np.asarray([np.log2(n) if n > 0 else 0 for n in sizes], dtype=np.float64)
         
         # Нормализуем
-        if max(insert_times) > 0:
-            norm = max(insert_times) / max(theoretical_log) if max(theoretical_log) > 0 else 1
-            theoretical_log = [t * norm for t in theoretical_log]
+        insert_max = insert_times.max()
+        t_log_max = theoretical_log.max()
+        if insert_max > 0:
+            norm = insert_max / t_log_max if t_log_max > 0 else 1
+            theoretical_log = theoretical_log * norm
         
-        ax2.loglog(sizes, insert_times, 'o-', label='insert (практика)', linewidth=2)
-        ax2.loglog(sizes, extract_times, 's-', label='extract (практика)', linewidth=2)
-        ax2.loglog(sizes, theoretical_log, '--', label='O(log n) (теория)', linewidth=2, alpha=0.7)
+        _set_line(ax2, lines, 'ax2_insert', sizes, insert_times, 'o-', label='insert (практика)', linewidth=2)
+        _set_line(ax2, lines, 'ax2_extract', sizes, extract_times, 's-', label='extract (практика)', linewidth=2)
+        _set_line(ax2, lines, 'ax2_theoretical_log', sizes, theoretical_log, '--', label='O(log n) (теория)', linewidth=2, alpha=0.7)
+        _rescale(ax2)
         ax2.set_xlabel('Размер кучи (log)', fontsize=12)
         ax2.set_ylabel('Нормализованное время (log)', fontsize=12)
         ax2.set_title('Сложность операций кучи', fontsize=14, fontweight='bold')
         ax2.legend()
         ax2.grid(True, alpha=0.3, which='both')
+    else:
+        _clear_axis(ax2, lines, 'ax2')
     
-    plt.tight_layout()
+    fig.tight_layout()
     
     if save_path:
-        os.makedirs(os.path.dirname(save_path), exist_ok=True)
-        plt.savefig(save_path, dpi=300, bbox_inches='tight')
-        print(f"График сохранен: {save_path}")
+        _save_figure(fig, save_path)
+        if verbose:
+            print(f"График сохранен: {save_path}")
     
+    fig.canvas.draw_idle()
     plt.show()
-    plt.close()
-
@@ -0,0 +1,111 @@
+"""
+Unit-тесты для модуля visualization.
+"""
+
+import unittest
+import sys
+import os
+import tempfile
+
+import matplotlib
+matplotlib.use('Agg')
+import matplotlib.image as mpimg
+import numpy as np
+
+# Добавляем путь к модулям
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+import visualization
+from visualization import plot_performance_comparison, plot_complexity_analysis
+
+
+def _series(*keys):
+    """Результаты измерений с заданными ключами серий на трех размерах."""
+    result = {'sizes': [100, 1000, 10000]}
+    for i, key in enumerate(keys, 1):
+        result[key] = [1e-4 * i, 1e-3 * i, 1e-2 * i]
+    return result
+
+
+def _all_results():
+    """Результаты со всеми разделами графика производительности."""
+    return {
+        'heap_build': _series('sequential', 'build_heap'),
+        'sorting': _series('heapsort', 'quicksort', 'mergesort'),
+        'heap_operations': _series('insert', 'extract'),
+    }
+
+
+class TestCachedFigures(unittest.TestCase):
+    """Тесты повторного использования закэшированных фигур."""
+    
+    def setUp(self):
+        visualization._fig_cache.clear()
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmpdir.cleanup)
+    
+    def _path(self, name):
+        return os.path.join(self.tmpdir.name, name)
+    
+    def test_performance_unfilled_axes_are_cleared(self):
+        """Оси, не заполняемые вторым вызовом, не сохраняют данные первого."""
+        plot_performance_comparison(_all_results(), self._path('all.png'), verbose=False)
+        plot_performance_comparison({'sorting': _series('heapsort', 'quicksort', 'mergesort')},
+                                    self._path('cached.png'), verbose=False)
+        
+        _, axes, lines = visualization._fig_cache['performance']
+        for ax in (axes[0, 0], axes[1, 0]):
+            self.assertEqual(ax.get_title(), '')
+            self.assertEqual(ax.get_xlabel(), '')
+            self.assertIsNone(ax.get_legend())
+            self.assertEqual(len(ax.lines), 0)
+        self.assertFalse(any(key.startswith(('ax1_', 'ax3_')) for key in lines))
+        
+        # Сохраненный график совпадает с графиком, построенным на новой фигуре
+        visualization._fig_cache.clear()
+        plot_performance_comparison({'sorting': _series('heapsort', 'quicksort', 'mergesort')},
+                                    self._path('fresh.png'), verbose=False)
+        cached = mpimg.imread(self._path('cached.png'))
+        fresh = mpimg.imread(self._path('fresh.png'))
+        self.assertEqual(cached.shape, fresh.shape)
+        self.assertTrue(np.array_equal(cached, fresh))
+    
+    def test_complexity_unfilled_axis_is_cleared(self):
+        """Ось операций очищается, если во втором вызове нет heap_operations."""
+        plot_complexity_analysis(_all_results(), self._path('all.png'), verbose=False)
+        plot_complexity_analysis({'heap_build': _series('sequential', 'build_heap')},
+                                 self._path('build.png'), verbose=False)
+        
+        _, axes, _ = visualization._fig_cache['complexity']
+        self.assertEqual(axes[1].get_title(), '')
+        self.assertIsNone(axes[1].get_legend())
+        self.assertEqual(len(axes[1].lines), 0)
+        self.assertEqual(axes[1].get_xscale(), 'log')
+    
+    def test_refilled_axis_shows_new_data(self):
+        """Ось, заполненная после очистки, строит линии заново."""
+        plot_performance_comparison(_all_results(), verbose=False)
+        plot_performance_comparison({'sorting': _series('heapsort', 'quicksort', 'mergesort')},
+                                    verbose=False)
+        plot_performance_comparison(_all_results(), verbose=False)
+        
+        _, axes, _ = visualization._fig_cache['performance']
+        self.assertEqual(len(axes[0, 0].lines), 2)
+        self.assertEqual(axes[0, 0].get_title(), 'Сравнение методов построения кучи')
+        self.assertIsNotNone(axes[0, 0].get_legend())
+
+    
+    def test_save_recreates_removed_directory(self):
+        """Сохранение создает заново директорию, удаленную между вызовами."""
+        save_path = os.path.join(self.tmpdir.name, 'out', 'plot.png')
+        results = {'sorting': _series('heapsort', 'quicksort', 'mergesort')}
+        plot_performance_comparison(results, save_path, verbose=False)
+        os.remove(save_path)
+        os.rmdir(os.path.dirname(save_path))
+        
+        plot_performance_comparison(results, save_path, verbose=False)
+        self.assertTrue(os.path.exists(save_path))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -4,6 +4,7 @@
 
 import os
 import sys
+from collections import Counter
 from pathlib import Path
 
 # Добавляем директорию modules в путь для импортов
@@ -26,143 +27,164 @@ from analysis import (
 )
 from visualization import (
     visualize_huffman_tree,
-    plot_performance_graph,
-    plot_compression_ratio,
+    plot_all,
     plot_knapsack_comparison
 )
 
+# Корень проекта (на уровень выше src) и директория для графиков
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+DOCS_DIR = PROJECT_ROOT / "docs"
+
+
+def _write_lines(lines):
+    """Выводит накопленные строки одной записью в stdout."""
+    if lines:
+        sys.stdout.write("\n".join(lines) + "\n")
+        lines.clear()
+
 
 def demo_interval_scheduling():
     """Демонстрация задачи о выборе заявок."""
-    print("\n" + "="*60)
-    print("1. ЗАДАЧА О ВЫБОРЕ ЗАЯВОК (Interval Scheduling)")
-    print("="*60)
+    lines = []
+    lines.append("\n" + "="*60)
+    lines.append("1. ЗАДАЧА О ВЫБОРЕ ЗАЯВОК (Interval Scheduling)")
+    lines.append("="*60)
     
     intervals = [(1, 4), (3, 5), (0, 6), (5, 7), (3, 8), 
                  (5, 9), (6, 10), (8, 11), (8, 12), (2, 13), (12, 14)]
     
-    print(f"\nИсходные интервалы: {intervals}")
+    lines.append(f"\nИсходные интервалы: {intervals}")
     
     selected = interval_scheduling(intervals)
-    print(f"\nВыбранные интервалы (жадный алгоритм): {selected}")
-    print(f"Количество выбранных интервалов: {len(selected)}")
+    lines.append(f"\nВыбранные интервалы (жадный алгоритм): {selected}")
+    lines.append(f"Количество выбранных интервалов: {len(selected)}")
     
-    # Сравнение с наивным подходом
-    print("\n--- Сравнение с наивным подходом ---")
+    # Сравнение с точным решением
+    lines.append("\n--- Сравнение с точным решением (динамическое программирование) ---")
     comparison = compare_greedy_vs_naive_interval_scheduling(intervals)
-    print(f"Жадный алгоритм: {comparison['greedy_count']} интервалов за {comparison['greedy_time']*1000:.4f} мс")
+    lines.append(f"Жадный алгоритм: {comparison['greedy_count']} интервалов за {comparison['greedy_time']*1000:.4f} мс")
     if comparison['naive_count'] is not None:
-        print(f"Наивный подход: {comparison['naive_count']} интервалов за {comparison['naive_time']*1000:.4f} мс")
-        print(f"Ускорение: {comparison['naive_time']/comparison['greedy_time']:.2f}x")
+        lines.append(f"Точное решение (ДП): {comparison['naive_count']} интервалов за {comparison['naive_time']*1000:.4f} мс")
+        lines.append(f"Ускорение: {comparison['naive_time']/comparison['greedy_time']:.2f}x")
+    
+    _write_lines(lines)
 
 
 def demo_fractional_knapsack():
     """Демонстрация задачи о непрерывном рюкзаке."""
-    print("\n" + "="*60)
-    print("2. НЕПРЕРЫВНЫЙ РЮКЗАК (Fractional Knapsack)")
-    print("="*60)
+    lines = []
+    lines.append("\n" + "="*60)
+    lines.append("2. НЕПРЕРЫВНЫЙ РЮКЗАК (Fractional Knapsack)")
+    lines.append("="*60)
     
     items = [(10, 60), (20, 100), (30, 120)]  # (вес, стоимость)
     capacity = 50
     
-    print(f"\nПредметы (вес, стоимость): {items}")
-    print(f"Вместимость рюкзака: {capacity}")
+    lines.append(f"\nПредметы (вес, стоимость): {items}")
+    lines.append(f"Вместимость рюкзака: {capacity}")
     
     value, selected = fractional_knapsack(items, capacity)
-    print(f"\nМаксимальная стоимость: {value:.2f}")
-    print(f"Выбранные предметы: {selected}")
+    lines.append(f"\nМаксимальная стоимость: {value:.2f}")
+    lines.append(f"Выбранные предметы: {selected}")
     
     # Сравнение с точным алгоритмом для 0-1 рюкзака
-    print("\n--- Сравнение с точным алгоритмом (0-1 рюкзак) ---")
+    lines.append("\n--- Сравнение с точным алгоритмом (0-1 рюкзак) ---")
     comparison = compare_knapsack_algorithms(items, capacity)
-    print(f"Жадный (непрерывный): стоимость = {comparison['greedy_value']:.2f}, "
-          f"время = {comparison['greedy_time']*1000:.4f} мс")
+    lines.append(f"Жадный (непрерывный): стоимость = {comparison['greedy_value']:.2f}, "
+                 f"время = {comparison['greedy_time']*1000:.4f} мс")
     
     if comparison['exact_value'] is not None:
-        print(f"Точный (0-1): стоимость = {comparison['exact_value']:.2f}, "
-              f"время = {comparison['exact_time']*1000:.4f} мс")
-        print(f"Разница в стоимости: {comparison['greedy_value'] - comparison['exact_value']:.2f}")
+        lines.append(f"Точный (0-1): стоимость = {comparison['exact_value']:.2f}, "
+                     f"время = {comparison['exact_time']*1000:.4f} мс")
+        lines.append(f"Разница в стоимости: {comparison['greedy_value'] - comparison['exact_value']:.2f}")
+        _write_lines(lines)
         
         # Визуализация
-        project_root = Path(__file__).parent.parent
-        plot_knapsack_comparison(comparison, str(project_root / "docs" / "knapsack_comparison.png"))
+        plot_knapsack_comparison(comparison, str(DOCS_DIR / "knapsack_comparison.png"))
+    
+    _write_lines(lines)
 
 
 def demo_huffman_coding():
     """Демонстрация алгоритма Хаффмана."""
-    print("\n" + "="*60)
-    print("3. АЛГОРИТМ ХАФФМАНА (Huffman Coding)")
-    print("="*60)
+    lines = []
+    lines.append("\n" + "="*60)
+    lines.append("3. АЛГОРИТМ ХАФФМАНА (Huffman Coding)")
+    lines.append("="*60)
     
-    project_root = Path(__file__).parent.parent
     text = "abracadabra"
-    print(f"\nИсходный текст: '{text}'")
+    lines.append(f"\nИсходный текст: '{text}'")
     
     codes, encoded = huffman_encode(text)
-    print(f"\nКоды символов:")
+    lines.append(f"\nКоды символов:")
     for char, code in sorted(codes.items()):
-        print(f"  '{char}': {code}")
+        lines.append(f"  '{char}': {code}")
     
-    print(f"\nЗакодированный текст: {encoded}")
-    print(f"Длина исходного текста (в битах, ASCII): {len(text) * 8}")
-    print(f"Длина закодированного текста: {len(encoded)}")
-    print(f"Коэффициент сжатия: {len(encoded) / (len(text) * 8):.2%}")
+    lines.append(f"\nЗакодированный текст: {encoded}")
+    lines.append(f"Длина исходного текста (в битах, ASCII): {len(text) * 8}")
+    lines.append(f"Длина закодированного текста: {len(encoded)}")
+    lines.append(f"Коэффициент сжатия: {len(encoded) / (len(text) * 8):.2%}")
     
     # Декодирование
     decoded = huffman_decode(encoded, codes)
-    print(f"\nДекодированный текст: '{decoded}'")
-    print(f"Корректность декодирования: {decoded == text}")
+    lines.append(f"\nДекодированный текст: '{decoded}'")
+    lines.append(f"Корректность декодирования: {decoded == text}")
+    _write_lines(lines)
     
     # Визуализация дерева
-    from collections import Counter
-    frequencies = dict(Counter(text))
+    frequencies = Counter(text)
     root = build_huffman_tree(frequencies)
-    data_path = project_root / "docs" / "huffman_tree.png"
+    data_path = DOCS_DIR / "huffman_tree.png"
     visualize_huffman_tree(root, str(data_path))
     
     # Экспериментальное исследование производительности
-    print("\n--- Экспериментальное исследование производительности ---")
+    lines.append("\n--- Экспериментальное исследование производительности ---")
+    _write_lines(lines)
     text_sizes = [100, 500, 1000, 5000, 10000, 50000, 100000]
     results = measure_huffman_performance(text_sizes)
     
-    print("\nРезультаты замеров:")
-    print(f"{'Размер':<10} {'Время (мс)':<15} {'Коэф. сжатия':<15} {'Уник. символов':<15}")
-    print("-" * 60)
+    lines.append("\nРезультаты замеров:")
+    lines.append(f"{'Размер':<10} {'Время (мс)':<15} {'Коэф. сжатия':<15} {'Уник. символов':<15}")
+    lines.append("-" * 60)
     for r in results:
-        print(f"{r['text_size']:<10} {r['total_time']*1000:<15.4f} "
-              f"{r['compression_ratio']:<15.4f} {r['unique_chars']:<15}")
+        lines.append(f"{r['text_size']:<10} {r['total_time']*1000:<15.4f} "
+                     f"{r['compression_ratio']:<15.4f} {r['unique_chars']:<15}")
+    _write_lines(lines)
     
     # Визуализация графиков
-    plot_performance_graph(results, str(project_root / "docs" / "performance_graph.png"))
-    plot_compression_ratio(results, str(project_root / "docs" / "compression_ratio.png"))
+    plot_all(results, str(DOCS_DIR))
 
 
 def demo_coin_change():
     """Демонстрация задачи о минимальном количестве монет."""
-    print("\n" + "="*60)
-    print("4. ЗАДАЧА О МИНИМАЛЬНОМ КОЛИЧЕСТВЕ МОНЕТ")
-    print("="*60)
+    lines = []
+    lines.append("\n" + "="*60)
+    lines.append("4. ЗАДАЧА О МИНИМАЛЬНОМ КОЛИЧЕСТВЕ МОНЕТ")
+    lines.append("="*60)
     
     amount = 67
     coins = [1, 5, 10, 25, 50]  # Стандартная система монет
     
-    print(f"\nСумма для выдачи: {amount}")
-    print(f"Доступные монеты: {coins}")
+    lines.append(f"\nСумма для выдачи: {amount}")
+    lines.append(f"Доступные монеты: {coins}")
     
     try:
         count, used_coins = coin_change_greedy(amount, coins)
-        print(f"\nМинимальное количество монет: {count}")
-        print(f"Использованные монеты: {used_coins}")
-        print(f"Проверка: {sum(used_coins)} = {amount}")
+        lines.append(f"\nМинимальное количество монет: {count}")
+        lines.append(f"Использованные монеты: {used_coins}")
+        lines.append(f"Проверка: {sum(used_coins)} = {amount}")
     except ValueError as e:
-        print(f"\nОшибка: {e}")
+        lines.append(f"\nОшибка: {e}")
+    
+    _write_lines(lines)
 
 
 def demo_prim_mst():
     """Демонстрация алгоритма Прима."""
-    print("\n" + "="*60)
-    print("5. АЛГОРИТМ ПРИМА (Минимальное остовное дерево)")
-    print("="*60)
+    lines = []
+    lines.append("\n" + "="*60)
+    lines.append("5. АЛГОРИТМ ПРИМА (Минимальное остовное дерево)")
+    lines.append("="*60)
     
     # Пример графа
     graph = {
@@ -177,17 +199,19 @@ def demo_prim_mst():
         'I': [('C', 2), ('G', 6), ('H', 7)]
     }
     
-    print("\nГраф (вершина: [(сосед, вес), ...]):")
+    lines.append("\nГраф (вершина: [(сосед, вес), ...]):")
     for vertex, edges in graph.items():
-        print(f"  {vertex}: {edges}")
+        lines.append(f"  {vertex}: {edges}")
     
     mst_edges = prim_mst(graph)
     total_weight = sum(edge[2] for edge in mst_edges)
     
-    print(f"\nРёбра минимального остовного дерева:")
+    lines.append(f"\nРёбра минимального остовного дерева:")
     for u, v, weight in mst_edges:
-        print(f"  {u} -- {v} (вес: {weight})")
-    print(f"\nОбщий вес MST: {total_weight}")
+        lines.append(f"  {u} -- {v} (вес: {weight})")
+    lines.append(f"\nОбщий вес MST: {total_weight}")
+    
+    _write_lines(lines)
 
 
 def main():
@@ -197,8 +221,7 @@ def main():
     print("="*60)
     
     # Создаем директорию для данных (относительно корня проекта)
-    project_root = Path(__file__).parent.parent
-    data_dir = project_root / "data"
+    data_dir = PROJECT_ROOT / "data"
     os.makedirs(data_dir, exist_ok=True)
     
     # Запускаем демонстрации
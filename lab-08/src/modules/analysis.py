@@ -2,17 +2,160 @@
 Модуль для сравнительного анализа эффективности жадных алгоритмов.
 """
 
+import os
 import time
+from bisect import bisect_right
+from concurrent.futures import ProcessPoolExecutor
 from typing import List, Tuple, Dict
-from itertools import product
 from collections import Counter
-from greedy_algorithms import fractional_knapsack, huffman_encode, build_huffman_tree, build_huffman_codes
+import numpy as np
+
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    # numba не обязательна: без неё используется векторный перебор NumPy
+    NUMBA_AVAILABLE = False
+    
+    def njit(*args, **kwargs):
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda func: func
+
+from greedy_algorithms import fractional_knapsack, build_huffman_tree, build_huffman_codes, pack_huffman_codes, huffman_encode_bits
+
+
+# Максимальное число предметов, для которого перебор выполняется матрицей
+# всех 2^n масок (2^20 x 20 элементов float64 ~ 160 МБ)
+VECTORIZED_KNAPSACK_MAX_ITEMS = 20
+
+
+# Явная сигнатура компилирует функцию при импорте модуля, а не при первом
+# вызове, чтобы время компиляции не попадало в замеры времени перебора
+# (см. также прогревочный вызов ниже)
+@njit("Tuple((float64, int64))(float64[:], float64[:], float64)", cache=True)
+def _knapsack_01_jit(weights, values, capacity):
+    """
+    Полный перебор 0-1 рюкзака, компилируемый numba.
+    
+    В отличие от векторного варианта не хранит матрицу всех масок:
+    суммы каждой комбинации считаются в скомпилированном цикле.
+    
+    Returns:
+        Кортеж (максимальная стоимость, маска лучшей комбинации)
+    """
+    n = weights.size
+    best_value = 0.0
+    best_mask = 0
+    for mask in range(1, 1 << n):
+        total_weight = 0.0
+        total_value = 0.0
+        for j in range(n):
+            if (mask >> j) & 1:
+                total_weight += weights[j]
+                total_value += values[j]
+        if total_weight <= capacity and total_value > best_value:
+            best_value = total_value
+            best_mask = mask
+    return best_value, best_mask
+
+
+if NUMBA_AVAILABLE:
+    # Первый вызов скомпилированной функции инициализирует диспетчер numba
+    # (~10 мс); выполняем его при импорте, а не внутри замера
+    _knapsack_01_jit(np.zeros(1), np.zeros(1), 0.0)
+
+
+def _knapsack_01_vectorized(weights: np.ndarray, values: np.ndarray, capacity: float) -> Tuple[float, int]:
+    """
+    Полный перебор 0-1 рюкзака одной матричной операцией NumPy.
+    
+    Строит матрицу (2^n, n) из битов всех масок и вычисляет веса и стоимости
+    всех комбинаций одним умножением на матрицу (n, 2) из весов и стоимостей.
+    
+    Returns:
+        Кортеж (максимальная стоимость, маска лучшей комбинации)
+    """
+    n = weights.size
+    masks = ((np.arange(1 << n, dtype=np.uint32)[:, None] >> np.arange(n, dtype=np.uint32)) & 1).astype(np.float64)
+    # Веса и стоимости всех комбинаций считаются за один проход по матрице масок
+    totals = masks @ np.column_stack((weights, values))
+    total_weights = totals[:, 0]
+    total_values = totals[:, 1]
+    
+    # Пустая комбинация (маска 0) имеет стоимость 0, поэтому при отсутствии
+    # допустимых непустых комбинаций ответом остается пустой рюкзак
+    feasible_values = np.where(total_weights <= capacity, total_values, -np.inf)
+    feasible_values[0] = 0.0
+    best_mask = int(np.argmax(feasible_values))
+    
+    return float(feasible_values[best_mask]), best_mask
+
+
+def _knapsack_01_branch_and_bound(weights: List[float], values: List[float], capacity: float) -> Tuple[float, List[int]]:
+    """
+    Точное решение 0-1 рюкзака методом ветвей и границ.
+    
+    Предметы перебираются в порядке убывания удельной стоимости; ветвь
+    отсекается, если даже жадное решение непрерывного рюкзака на оставшихся
+    предметах не позволяет превысить лучшую найденную стоимость.
+    
+    Returns:
+        Кортеж (максимальная стоимость, список индексов выбранных предметов)
+    """
+    order = sorted(range(len(weights)),
+                   key=lambda i: values[i] / weights[i] if weights[i] > 0 else float('inf'),
+                   reverse=True)
+    sorted_weights = [weights[i] for i in order]
+    sorted_values = [values[i] for i in order]
+    n = len(order)
+    
+    best_value = 0.0
+    best_taken = []
+    taken = []
+    
+    def upper_bound(index, remaining, current_value):
+        """Верхняя граница стоимости: непрерывный рюкзак на предметах index..n-1."""
+        bound = current_value
+        for i in range(index, n):
+            weight = sorted_weights[i]
+            if weight <= remaining:
+                remaining -= weight
+                bound += sorted_values[i]
+            else:
+                return bound + sorted_values[i] * remaining / weight
+        return bound
+    
+    def search(index, remaining, current_value):
+        nonlocal best_value, best_taken
+        if current_value > best_value:
+            best_value = current_value
+            best_taken = list(taken)
+        if index == n or upper_bound(index, remaining, current_value) <= best_value:
+            return
+        
+        # Сначала ветвь с предметом: она быстрее дает хорошую нижнюю оценку
+        if sorted_weights[index] <= remaining:
+            taken.append(order[index])
+            search(index + 1, remaining - sorted_weights[index], current_value + sorted_values[index])
+            taken.pop()
+        search(index + 1, remaining, current_value)
+    
+    if capacity >= 0:
+        search(0, capacity, 0.0)
+    
+    return best_value, sorted(best_taken)
 
 
 def knapsack_01_bruteforce(items: List[Tuple[float, float]], capacity: float) -> Tuple[float, List[int]]:
     """
     Точное решение задачи 0-1 рюкзака методом полного перебора.
     
+    Для n <= VECTORIZED_KNAPSACK_MAX_ITEMS выполняется полный перебор:
+    скомпилированный numba (если она установлена) или векторный в NumPy;
+    для больших n - методом ветвей и границ, который отсекает
+    заведомо неоптимальные комбинации и остается точным.
+    
     Args:
         items: Список предметов в формате (вес, стоимость)
         capacity: Вместимость рюкзака
@@ -20,25 +163,45 @@ def knapsack_01_bruteforce(items: List[Tuple[float, float]], capacity: float) ->
     Returns:
         Кортеж (максимальная стоимость, список индексов выбранных предметов)
     
-    Временная сложность: O(2^n) - экспоненциальная
+    Временная сложность: O(2^n) - экспоненциальная (в худшем случае)
     """
     n = len(items)
-    max_value = 0.0
-    best_combination = []
     
-    # Перебираем все возможные комбинации
-    for combination in product([0, 1], repeat=n):
-        total_weight = sum(items[i][0] for i in range(n) if combination[i] == 1)
-        total_value = sum(items[i][1] for i in range(n) if combination[i] == 1)
-        
-        if total_weight <= capacity and total_value > max_value:
-            max_value = total_value
-            best_combination = [i for i in range(n) if combination[i] == 1]
+    if n <= VECTORIZED_KNAPSACK_MAX_ITEMS:
+        weights = np.array([weight for weight, _ in items], dtype=np.float64)
+        values = np.array([value for _, value in items], dtype=np.float64)
+        if NUMBA_AVAILABLE:
+            max_value, best_mask = _knapsack_01_jit(weights, values, float(capacity))
+        else:
+            max_value, best_mask = _knapsack_01_vectorized(weights, values, capacity)
+        best_combination = [i for i in range(n) if best_mask >> i & 1]
+        return max_value, best_combination
     
-    return max_value, best_combination
+    weights = [float(weight) for weight, _ in items]
+    values = [float(value) for _, value in items]
+    return _knapsack_01_branch_and_bound(weights, values, capacity)
 
 
-def compare_knapsack_algorithms(items: List[Tuple[float, float]], capacity: float) -> Dict:
+# Пул процессов для точных решений, создается при первом использовании
+_executor = None
+
+
+def _get_executor() -> ProcessPoolExecutor:
+    """Возвращает общий пул процессов модуля, создавая его при необходимости."""
+    global _executor
+    if _executor is None:
+        _executor = ProcessPoolExecutor(max_workers=os.cpu_count())
+    return _executor
+
+
+def _timed_knapsack_01_bruteforce(items: List[Tuple[float, float]], capacity: float) -> Tuple[float, List[int], float]:
+    """Точное решение 0-1 рюкзака с замером времени (для запуска в пуле процессов)."""
+    start_time = time.perf_counter()
+    exact_value, exact_items = knapsack_01_bruteforce(items, capacity)
+    return exact_value, exact_items, time.perf_counter() - start_time
+
+
+def compare_knapsack_algorithms(items: List[Tuple[float, float]], capacity: float, parallel: bool = False) -> Dict:
     """
     Сравнение жадного алгоритма для непрерывного рюкзака и точного алгоритма
     для дискретного 0-1 рюкзака.
@@ -46,20 +209,29 @@ def compare_knapsack_algorithms(items: List[Tuple[float, float]], capacity: floa
     Args:
         items: Список предметов в формате (вес, стоимость)
         capacity: Вместимость рюкзака
+        parallel: Выполнять ли точный алгоритм в общем пуле процессов модуля.
+            Точное решение отправляется в пул до запуска жадного алгоритма,
+            поэтому при сравнении на многих входных данных переборы
+            выполняются на нескольких ядрах. Время каждого алгоритма
+            замеряется там, где он выполняется.
     
     Returns:
         Словарь с результатами сравнения
     """
+    # Точный алгоритм для 0-1 рюкзака (только для маленьких входных данных)
+    exact_future = None
+    if parallel and len(items) <= 15:
+        exact_future = _get_executor().submit(_timed_knapsack_01_bruteforce, items, capacity)
+    
     # Жадный алгоритм для непрерывного рюкзака
     start_time = time.perf_counter()
     greedy_value, greedy_items = fractional_knapsack(items, capacity)
     greedy_time = time.perf_counter() - start_time
     
-    # Точный алгоритм для 0-1 рюкзака (только для маленьких входных данных)
-    if len(items) <= 15:  # Ограничение для полного перебора
-        start_time = time.perf_counter()
-        exact_value, exact_items = knapsack_01_bruteforce(items, capacity)
-        exact_time = time.perf_counter() - start_time
+    if exact_future is not None:
+        exact_value, exact_items, exact_time = exact_future.result()
+    elif len(items) <= 15:  # Ограничение для полного перебора
+        exact_value, exact_items, exact_time = _timed_knapsack_01_bruteforce(items, capacity)
     else:
         exact_value = None
         exact_items = None
@@ -105,25 +277,27 @@ def measure_huffman_performance(text_sizes: List[int], base_text: str = None) ->
             # Повторяем базовый текст
             test_text = (base_text * ((size // len(base_text)) + 1))[:size]
         
-        # Замер времени кодирования
-        start_time = time.perf_counter()
-        codes, encoded = huffman_encode(test_text)
-        encode_time = time.perf_counter() - start_time
+        # Подсчет частот выполняется один раз, дерево и коды строятся
+        # один раз и переиспользуются для кодирования
+        frequencies = Counter(test_text)
         
         # Замер времени построения дерева
-        frequencies = dict(Counter(test_text))
         start_time = time.perf_counter()
         tree = build_huffman_tree(frequencies)
         tree_time = time.perf_counter() - start_time
         
         # Замер времени построения кодов
         start_time = time.perf_counter()
-        codes_dict = build_huffman_codes(tree)
+        codes = build_huffman_codes(tree)
         codes_time = time.perf_counter() - start_time
         
+        # Замер времени кодирования в упакованный битовый поток
+        start_time = time.perf_counter()
+        encoded, compressed_bits = huffman_encode_bits(test_text, pack_huffman_codes(codes))
+        encode_time = time.perf_counter() - start_time
+        
         # Вычисляем коэффициент сжатия
         original_bits = len(test_text) * 8  # Предполагаем 8 бит на символ
-        compressed_bits = len(encoded)
         compression_ratio = compressed_bits / original_bits if original_bits > 0 else 0
         
         results.append({
@@ -131,7 +305,7 @@ def measure_huffman_performance(text_sizes: List[int], base_text: str = None) ->
             'encode_time': encode_time,
             'tree_time': tree_time,
             'codes_time': codes_time,
-            'total_time': encode_time,
+            'total_time': tree_time + codes_time + encode_time,
             'compression_ratio': compression_ratio,
             'unique_chars': len(frequencies)
         })
@@ -139,11 +313,57 @@ def measure_huffman_performance(text_sizes: List[int], base_text: str = None) ->
     return results
 
 
+def interval_scheduling_dp(intervals: List[Tuple[int, int]]) -> List[Tuple[int, int]]:
+    """
+    Точное решение задачи о выборе заявок динамическим программированием.
+    
+    Интервалы сортируются по времени окончания; для каждого интервала i
+    бинарным поиском находится p[i] - число предшествующих интервалов,
+    заканчивающихся не позже начала i. Тогда
+    dp[i + 1] = max(dp[i], 1 + dp[p[i]]).
+    
+    Args:
+        intervals: Список интервалов в формате (начало, конец)
+    
+    Returns:
+        Список выбранных интервалов максимального размера (по возрастанию окончания)
+    
+    Временная сложность: O(n log n)
+    """
+    # При равных окончаниях интервал нулевой длины должен идти после
+    # интервалов, которые в нем заканчиваются, поэтому сортируем по (конец, начало)
+    sorted_intervals = sorted(intervals, key=lambda x: (x[1], x[0]))
+    ends = [end for _, end in sorted_intervals]
+    n = len(sorted_intervals)
+    
+    p = [bisect_right(ends, start, 0, i) for i, (start, _) in enumerate(sorted_intervals)]
+    
+    dp = [0] * (n + 1)
+    for i in range(n):
+        dp[i + 1] = max(dp[i], 1 + dp[p[i]])
+    
+    # Восстанавливаем ответ обратным ходом
+    selected = []
+    i = n
+    while i > 0:
+        if dp[i] != dp[i - 1]:
+            selected.append(sorted_intervals[i - 1])
+            i = p[i - 1]
+        else:
+            i -= 1
+    selected.reverse()
+    
+    return selected
+
+
 def compare_greedy_vs_naive_interval_scheduling(intervals: List[Tuple[int, int]]) -> Dict:
     """
-    Сравнение жадного алгоритма и наивного подхода для задачи о выборе заявок.
+    Сравнение жадного алгоритма и точного решения для задачи о выборе заявок.
     
-    Наивный подход: перебор всех возможных комбинаций интервалов.
+    Точное решение вычисляется динамическим программированием
+    (interval_scheduling_dp) за O(n log n) вместо перебора всех комбинаций
+    за O(2^n), поэтому ограничение на размер входных данных не требуется.
+    Ключи naive_* сохранены для совместимости.
     
     Args:
         intervals: Список интервалов
@@ -158,35 +378,10 @@ def compare_greedy_vs_naive_interval_scheduling(intervals: List[Tuple[int, int]]
     greedy_result = interval_scheduling(intervals)
     greedy_time = time.perf_counter() - start_time
     
-    # Наивный подход (только для маленьких входных данных)
-    if len(intervals) <= 15:
-        start_time = time.perf_counter()
-        
-        def is_valid_combination(combo):
-            """Проверяет, что интервалы не пересекаются."""
-            sorted_combo = sorted(combo, key=lambda x: x[0])
-            for i in range(len(sorted_combo) - 1):
-                if sorted_combo[i][1] > sorted_combo[i + 1][0]:
-                    return False
-            return True
-        
-        max_count = 0
-        best_combination = []
-        
-        # Перебираем все возможные комбинации
-        from itertools import combinations
-        for r in range(1, len(intervals) + 1):
-            for combo in combinations(intervals, r):
-                if is_valid_combination(combo):
-                    if len(combo) > max_count:
-                        max_count = len(combo)
-                        best_combination = list(combo)
-        
-        naive_time = time.perf_counter() - start_time
-        naive_result = best_combination
-    else:
-        naive_time = None
-        naive_result = None
+    # Точное решение динамическим программированием
+    start_time = time.perf_counter()
+    naive_result = interval_scheduling_dp(intervals)
+    naive_time = time.perf_counter() - start_time
     
     return {
         'greedy_count': len(greedy_result),
@@ -197,4 +392,3 @@ def compare_greedy_vs_naive_interval_scheduling(intervals: List[Tuple[int, int]]
         'naive_result': naive_result,
         'intervals_count': len(intervals)
     }
-
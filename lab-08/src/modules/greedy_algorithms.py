@@ -5,6 +5,13 @@
 from typing import List, Tuple, Dict
 from collections import Counter, deque
 import heapq
+import numpy as np
+
+
+# Минимальное число предметов, начиная с которого непрерывный рюкзак
+# решается на массивах NumPy (для малых входных данных накладные расходы
+# на создание массивов больше выигрыша)
+NUMPY_KNAPSACK_MIN_ITEMS = 1000
 
 
 def interval_scheduling(intervals: List[Tuple[int, int]]) -> List[Tuple[int, int]]:
@@ -61,6 +68,9 @@ def fractional_knapsack(items: List[Tuple[float, float]], capacity: float) -> Tu
     if not items or capacity <= 0:
         return 0.0, []
     
+    if len(items) >= NUMPY_KNAPSACK_MIN_ITEMS:
+        return _fractional_knapsack_numpy(items, capacity)
+    
     # Вычисляем удельную стоимость и сортируем по убыванию
     items_with_ratio = [(value / weight, weight, value) for weight, value in items]
     items_with_ratio.sort(reverse=True, key=lambda x: x[0])
@@ -88,6 +98,40 @@ def fractional_knapsack(items: List[Tuple[float, float]], capacity: float) -> Tu
     return total_value, selected_items
 
 
+def _fractional_knapsack_numpy(items: List[Tuple[float, float]], capacity: float) -> Tuple[float, List[Tuple[float, float]]]:
+    """
+    Непрерывный рюкзак на массивах NumPy для больших входных данных.
+    
+    Предметы упорядочиваются одним argsort по удельной стоимости, а число
+    целиком помещающихся предметов находится бинарным поиском по
+    накопленным весам.
+    """
+    weights = np.array([weight for weight, _ in items], dtype=np.float64)
+    values = np.array([value for _, value in items], dtype=np.float64)
+    
+    # Устойчивая сортировка по убыванию сохраняет исходный порядок равных предметов
+    order = np.argsort(-(values / weights), kind='stable')
+    sorted_weights = weights[order]
+    sorted_values = values[order]
+    
+    # k - количество предметов, которые берутся целиком
+    cumulative_weights = np.cumsum(sorted_weights)
+    k = int(np.searchsorted(cumulative_weights, capacity, side='right'))
+    
+    total_value = float(sorted_values[:k].sum())
+    selected_items = list(zip(sorted_weights[:k].tolist(), sorted_values[:k].tolist()))
+    
+    remaining_capacity = capacity - (float(cumulative_weights[k - 1]) if k > 0 else 0.0)
+    if k < len(items) and remaining_capacity > 0:
+        # Берем дробную часть следующего предмета
+        fraction = remaining_capacity / sorted_weights[k]
+        partial_value = float(sorted_values[k] * fraction)
+        total_value += partial_value
+        selected_items.append((remaining_capacity, partial_value))
+    
+    return total_value, selected_items
+
+
 class HuffmanNode:
     """Узел дерева Хаффмана."""
     
@@ -111,7 +155,8 @@ def build_huffman_tree(frequencies: Dict[str, int]) -> HuffmanNode:
     Returns:
         Корневой узел дерева Хаффмана
     
-    Временная сложность: O(n log n), где n - количество уникальных символов
+    Временная сложность: O(n log n) на сортировку частот, после которой
+    дерево строится за O(n), где n - количество уникальных символов
     """
     if not frequencies:
         return None
@@ -120,34 +165,44 @@ def build_huffman_tree(frequencies: Dict[str, int]) -> HuffmanNode:
         char = list(frequencies.keys())[0]
         return HuffmanNode(char=char, freq=frequencies[char])
     
-    # Создаем приоритетную очередь (мин-кучу)
-    heap = []
-    for char, freq in frequencies.items():
-        heapq.heappush(heap, HuffmanNode(char=char, freq=freq))
+    # Алгоритм двух очередей: листья отсортированы по частоте один раз,
+    # а объединенные узлы создаются в неубывающем порядке частот, поэтому
+    # минимальный элемент всегда находится в начале одной из очередей
+    leaves = deque(HuffmanNode(char=char, freq=freq)
+                   for char, freq in sorted(frequencies.items(), key=lambda x: x[1]))
+    internals = deque()
+    
+    def pop_min():
+        if not internals or (leaves and leaves[0].freq <= internals[0].freq):
+            return leaves.popleft()
+        return internals.popleft()
     
     # Строим дерево
-    while len(heap) > 1:
-        left = heapq.heappop(heap)
-        right = heapq.heappop(heap)
+    while len(leaves) + len(internals) > 1:
+        left = pop_min()
+        right = pop_min()
         
         merged = HuffmanNode(
             freq=left.freq + right.freq,
             left=left,
             right=right
         )
-        heapq.heappush(heap, merged)
+        internals.append(merged)
     
-    return heap[0]
+    return internals[0]
 
 
 def build_huffman_codes(root: HuffmanNode, code: str = "", codes: Dict[str, str] = None) -> Dict[str, str]:
     """
     Построение кодов Хаффмана из дерева.
     
+    Обход выполняется итеративно по явному стеку, поэтому глубина дерева
+    не ограничена глубиной рекурсии.
+    
     Args:
         root: Корневой узел дерева
-        code: Текущий код (для рекурсии)
-        codes: Словарь кодов (для рекурсии)
+        code: Префикс кода корневого узла
+        codes: Словарь кодов для дополнения (по умолчанию создается новый)
     
     Returns:
         Словарь символов и их кодов
@@ -155,18 +210,20 @@ def build_huffman_codes(root: HuffmanNode, code: str = "", codes: Dict[str, str]
     if codes is None:
         codes = {}
     
-    if root is None:
-        return codes
-    
-    # Если это лист
-    if root.char is not None:
-        if code:
-            codes[root.char] = code
-        else:
-            codes[root.char] = "0"  # Случай одного символа
-    
-    build_huffman_codes(root.left, code + "0", codes)
-    build_huffman_codes(root.right, code + "1", codes)
+    stack = [(root, code)]
+    while stack:
+        node, node_code = stack.pop()
+        if node is None:
+            continue
+        
+        # Если это лист
+        if node.char is not None:
+            codes[node.char] = node_code or "0"  # "0" - случай одного символа
+        
+        # Правый потомок кладется первым, чтобы левое поддерево
+        # обрабатывалось раньше, как при рекурсивном обходе
+        stack.append((node.right, node_code + "1"))
+        stack.append((node.left, node_code + "0"))
     
     return codes
 
@@ -185,7 +242,7 @@ def huffman_encode(text: str) -> Tuple[Dict[str, str], str]:
         return {}, ""
     
     # Подсчет частот
-    frequencies = dict(Counter(text))
+    frequencies = Counter(text)
     
     # Построение дерева
     root = build_huffman_tree(frequencies)
@@ -194,11 +251,85 @@ def huffman_encode(text: str) -> Tuple[Dict[str, str], str]:
     codes = build_huffman_codes(root)
     
     # Кодирование
-    encoded = "".join(codes[char] for char in text)
+    encoded = huffman_encode_text(text, codes)
     
     return codes, encoded
 
 
+def huffman_encode_text(text: str, codes: Dict[str, str]) -> str:
+    """
+    Кодирование текста по готовому словарю кодов Хаффмана.
+    
+    Для ASCII-текстов коды берутся из таблицы, индексированной байтами
+    текста, что быстрее поиска каждого символа в словаре.
+    
+    Args:
+        text: Входной текст
+        codes: Словарь кодов символов
+    
+    Returns:
+        Закодированная строка
+    """
+    if text.isascii():
+        table = [None] * 128
+        for char, code in codes.items():
+            table[ord(char)] = code
+        # Итерация по байтам дает коды символов (аналог map(ord, text)),
+        # а map с bound-методом обходится без байткода цикла на каждый символ
+        return "".join(map(table.__getitem__, text.encode('ascii')))
+    
+    return "".join(map(codes.__getitem__, text))
+
+
+def pack_huffman_codes(codes: Dict[str, str]) -> Dict[str, Tuple[int, int]]:
+    """
+    Представление кодов Хаффмана в виде пар (биты кода как int, длина кода).
+    
+    Args:
+        codes: Словарь кодов символов в виде строк из "0" и "1"
+    
+    Returns:
+        Словарь символов и пар (значение, длина в битах)
+    """
+    return {char: (int(code, 2), len(code)) for char, code in codes.items()}
+
+
+def huffman_encode_bits(text: str, packed_codes: Dict[str, Tuple[int, int]]) -> Tuple[bytes, int]:
+    """
+    Кодирование текста в упакованный битовый поток.
+    
+    Биты кодов накапливаются сдвигами в целочисленном буфере и выводятся
+    по байту, поэтому результат занимает в 8 раз меньше памяти, чем
+    строковое представление. Последний байт дополняется нулями справа.
+    
+    Args:
+        text: Входной текст
+        packed_codes: Коды в формате pack_huffman_codes
+    
+    Returns:
+        Кортеж (байты закодированного потока, длина потока в битах)
+    """
+    out = bytearray()
+    buffer = 0
+    buffer_bits = 0
+    total_bits = 0
+    
+    for char in text:
+        value, length = packed_codes[char]
+        buffer = (buffer << length) | value
+        buffer_bits += length
+        total_bits += length
+        while buffer_bits >= 8:
+            buffer_bits -= 8
+            out.append((buffer >> buffer_bits) & 0xFF)
+        buffer &= (1 << buffer_bits) - 1
+    
+    if buffer_bits:
+        out.append((buffer << (8 - buffer_bits)) & 0xFF)
+    
+    return bytes(out), total_bits
+
+
 def huffman_decode(encoded: str, codes: Dict[str, str]) -> str:
     """
     Декодирование текста по кодам Хаффмана.
@@ -213,17 +344,29 @@ def huffman_decode(encoded: str, codes: Dict[str, str]) -> str:
     if not encoded or not codes:
         return ""
     
-    # Создаем обратный словарь
-    reverse_codes = {v: k for k, v in codes.items()}
-    
+    # Строим префиксное дерево кодов: узел - список [потомок по "0", потомок по "1", символ]
+    root = [None, None, None]
+    for char, code in codes.items():
+        node = root
+        for bit in code:
+            index = 0 if bit == "0" else 1
+            if node[index] is None:
+                node[index] = [None, None, None]
+            node = node[index]
+        node[2] = char
+    
+    # Спускаемся по дереву на каждый бит и выдаем символ при достижении листа
     decoded = []
-    current_code = ""
+    node = root
     
     for bit in encoded:
-        current_code += bit
-        if current_code in reverse_codes:
-            decoded.append(reverse_codes[current_code])
-            current_code = ""
+        node = node[0] if bit == "0" else node[1]
+        if node is None:
+            # Последовательность битов не соответствует ни одному коду
+            break
+        if node[2] is not None:
+            decoded.append(node[2])
+            node = root
     
     return "".join(decoded)
 
@@ -284,38 +427,45 @@ def prim_mst(graph: Dict[str, List[Tuple[str, int]]]) -> List[Tuple[str, str, in
         return []
     
     # Выбираем первую вершину
-    start_vertex = list(graph.keys())[0]
+    start_vertex = next(iter(graph))
     
     # Множества для отслеживания включенных вершин
     included = set()
     mst_edges = []
     
-    # Приоритетная очередь для рёбер: (вес, вершина1, вершина2)
+    # Приоритетная очередь для рёбер: (вес, вершина). Вершина, из которой
+    # ведет лучшее известное ребро, хранится отдельно в parent_of; ребро
+    # кладется в очередь, только если оно легче уже известного для вершины
     edges_heap = []
+    parent_of = {}
+    best_weight = {}
+    
+    def relax(u):
+        for neighbor, edge_weight in graph[u]:
+            if neighbor not in included and edge_weight < best_weight.get(neighbor, float('inf')):
+                best_weight[neighbor] = edge_weight
+                parent_of[neighbor] = u
+                heapq.heappush(edges_heap, (edge_weight, neighbor))
     
     # Начинаем с начальной вершины
     included.add(start_vertex)
     
     # Добавляем все рёбра из начальной вершины
-    for neighbor, weight in graph[start_vertex]:
-        heapq.heappush(edges_heap, (weight, start_vertex, neighbor))
+    relax(start_vertex)
     
     while edges_heap and len(included) < len(graph):
-        weight, u, v = heapq.heappop(edges_heap)
+        weight, v = heapq.heappop(edges_heap)
         
-        # Пропускаем, если обе вершины уже включены
+        # Пропускаем устаревшие записи для уже включенных вершин
         if v in included:
             continue
         
         # Добавляем ребро в MST
         included.add(v)
-        mst_edges.append((u, v, weight))
+        mst_edges.append((parent_of[v], v, weight))
         
         # Добавляем рёбра из новой вершины
         if v in graph:
-            for neighbor, edge_weight in graph[v]:
-                if neighbor not in included:
-                    heapq.heappush(edges_heap, (edge_weight, v, neighbor))
+            relax(v)
     
     return mst_edges
-
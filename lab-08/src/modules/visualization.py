@@ -4,18 +4,41 @@
 
 import matplotlib.pyplot as plt
 import matplotlib.patches as mpatches
+from matplotlib.figure import Figure
 from typing import Dict, List
 import os
 from greedy_algorithms import HuffmanNode
 
 
-def visualize_huffman_tree(root: HuffmanNode, output_path: str = "docs/huffman_tree.png"):
+def _new_figure(show: bool, **kwargs) -> Figure:
+    """
+    Создание фигуры для построения графика.
+    
+    Если график не нужно показывать на экране, фигура создается напрямую
+    через объектный API без pyplot, поэтому GUI-бэкенд не инициализируется.
+    """
+    if show:
+        return plt.figure(**kwargs)
+    return Figure(**kwargs)
+
+
+def _finish_figure(fig: Figure, output_path: str, show: bool):
+    """Сохранение фигуры и, при необходимости, показ на экране."""
+    fig.tight_layout()
+    fig.savefig(output_path, dpi=300, bbox_inches='tight')
+    if show:
+        plt.show()
+        plt.close(fig)
+
+
+def visualize_huffman_tree(root: HuffmanNode, output_path: str = "docs/huffman_tree.png", show: bool = False):
     """
     Визуализация дерева кодов Хаффмана.
     
     Args:
         root: Корневой узел дерева Хаффмана
         output_path: Путь для сохранения изображения
+        show: Показать ли изображение на экране после сохранения
     """
     if root is None:
         return
@@ -25,13 +48,17 @@ def visualize_huffman_tree(root: HuffmanNode, output_path: str = "docs/huffman_t
     if dirname:
         os.makedirs(dirname, exist_ok=True)
     
-    fig, ax = plt.subplots(figsize=(12, 8))
+    fig = _new_figure(show, figsize=(12, 8))
+    ax = fig.subplots()
     ax.axis('off')
     
-    # Рекурсивная функция для отрисовки дерева
-    def draw_node(node, x, y, dx, dy, level=0):
-        if node is None:
-            return
+    # Отрисовка узла и ребра, ведущего в него от родителя
+    def draw_node(node, x, y, parent, edge_label):
+        if parent is not None:
+            parent_x, parent_y = parent
+            ax.plot([parent_x, x], [parent_y - 0.3, y + 0.3], 'k-', linewidth=1.5)
+            ax.text((parent_x + x) / 2, (parent_y + y) / 2, edge_label, ha='center', va='center',
+                   bbox=dict(boxstyle='round,pad=0.3', facecolor='white', edgecolor='black'))
         
         # Определяем цвет узла
         if node.char is not None:
@@ -42,35 +69,37 @@ def visualize_huffman_tree(root: HuffmanNode, output_path: str = "docs/huffman_t
             label = f"{node.freq}"
         
         # Рисуем узел
-        circle = plt.Circle((x, y), 0.3, color=color, ec='black', linewidth=2)
+        circle = mpatches.Circle((x, y), 0.3, color=color, ec='black', linewidth=2)
         ax.add_patch(circle)
         ax.text(x, y, label, ha='center', va='center', fontsize=8, weight='bold')
-        
-        # Рисуем рёбра и дочерние узлы
-        if node.left is not None:
-            child_x = x - dx
-            child_y = y - dy
-            ax.plot([x, child_x], [y - 0.3, child_y + 0.3], 'k-', linewidth=1.5)
-            ax.text((x + child_x) / 2, (y + child_y) / 2, '0', ha='center', va='center',
-                   bbox=dict(boxstyle='round,pad=0.3', facecolor='white', edgecolor='black'))
-            draw_node(node.left, child_x, child_y, dx * 0.6, dy, level + 1)
-        
-        if node.right is not None:
-            child_x = x + dx
-            child_y = y - dy
-            ax.plot([x, child_x], [y - 0.3, child_y + 0.3], 'k-', linewidth=1.5)
-            ax.text((x + child_x) / 2, (y + child_y) / 2, '1', ha='center', va='center',
-                   bbox=dict(boxstyle='round,pad=0.3', facecolor='white', edgecolor='black'))
-            draw_node(node.right, child_x, child_y, dx * 0.6, dy, level + 1)
     
-    # Вычисляем высоту дерева для масштабирования
+    # Вычисляем высоту дерева (число уровней) обходом по явному стеку
     def tree_height(node):
-        if node is None:
-            return 0
-        return 1 + max(tree_height(node.left), tree_height(node.right))
+        height = 0
+        stack = [(node, 1)]
+        while stack:
+            current, depth = stack.pop()
+            if current is None:
+                continue
+            height = max(height, depth)
+            stack.append((current.left, depth + 1))
+            stack.append((current.right, depth + 1))
+        return height
     
     height = tree_height(root)
-    draw_node(root, 0, height, 2, 1.5)
+    dy = 1.5
+    
+    # Прямой обход по явному стеку (без рекурсии): правый потомок кладется
+    # первым, чтобы левое поддерево рисовалось раньше правого
+    stack = [(root, 0, height, 2, None, None)]
+    while stack:
+        node, x, y, dx, parent, edge_label = stack.pop()
+        draw_node(node, x, y, parent, edge_label)
+        
+        if node.right is not None:
+            stack.append((node.right, x + dx, y - dy, dx * 0.6, (x, y), '1'))
+        if node.left is not None:
+            stack.append((node.left, x - dx, y - dy, dx * 0.6, (x, y), '0'))
     
     # Устанавливаем границы
     ax.set_xlim(-height * 2, height * 2)
@@ -81,81 +110,112 @@ def visualize_huffman_tree(root: HuffmanNode, output_path: str = "docs/huffman_t
     internal_patch = mpatches.Patch(color='lightgreen', label='Внутренний узел')
     ax.legend(handles=[leaf_patch, internal_patch], loc='upper right')
     
-    plt.title('Дерево кодов Хаффмана', fontsize=14, weight='bold')
-    plt.tight_layout()
-    plt.savefig(output_path, dpi=300, bbox_inches='tight')
-    plt.show()
-    plt.close()
+    ax.set_title('Дерево кодов Хаффмана', fontsize=14, weight='bold')
+    _finish_figure(fig, output_path, show)
     print(f"Дерево Хаффмана сохранено в {output_path}")
 
 
-def plot_performance_graph(results: List[Dict], output_path: str = "docs/performance_graph.png"):
+def _draw_performance_graph(fig: Figure, results: List[Dict]):
+    """Отрисовка графика времени работы алгоритма Хаффмана на фигуре fig."""
+    sizes = [r['text_size'] for r in results]
+    times = [r['total_time'] for r in results]
+    
+    ax = fig.subplots()
+    ax.plot(sizes, times, 'b-o', linewidth=2, markersize=6, label='Время выполнения')
+    ax.set_xlabel('Размер входных данных (символов)', fontsize=12)
+    ax.set_ylabel('Время выполнения (секунды)', fontsize=12)
+    ax.set_title('Зависимость времени работы алгоритма Хаффмана от размера данных', 
+                 fontsize=14, weight='bold')
+    ax.grid(True, alpha=0.3)
+    ax.legend(fontsize=11)
+
+
+def _draw_compression_ratio(fig: Figure, results: List[Dict]):
+    """Отрисовка графика коэффициента сжатия на фигуре fig."""
+    sizes = [r['text_size'] for r in results]
+    ratios = [r['compression_ratio'] for r in results]
+    
+    ax = fig.subplots()
+    ax.plot(sizes, ratios, 'g-s', linewidth=2, markersize=6, label='Коэффициент сжатия')
+    ax.set_xlabel('Размер входных данных (символов)', fontsize=12)
+    ax.set_ylabel('Коэффициент сжатия', fontsize=12)
+    ax.set_title('Эффективность сжатия алгоритмом Хаффмана', 
+                 fontsize=14, weight='bold')
+    ax.grid(True, alpha=0.3)
+    ax.legend(fontsize=11)
+
+
+def plot_performance_graph(results: List[Dict], output_path: str = "docs/performance_graph.png", show: bool = False):
     """
     Построение графика зависимости времени работы алгоритма от размера входных данных.
     
     Args:
         results: Список словарей с результатами замеров
         output_path: Путь для сохранения графика
+        show: Показать ли график на экране после сохранения
     """
     dirname = os.path.dirname(output_path)
     if dirname:
         os.makedirs(dirname, exist_ok=True)
     
-    sizes = [r['text_size'] for r in results]
-    times = [r['total_time'] for r in results]
-    
-    plt.figure(figsize=(10, 6))
-    plt.plot(sizes, times, 'b-o', linewidth=2, markersize=6, label='Время выполнения')
-    plt.xlabel('Размер входных данных (символов)', fontsize=12)
-    plt.ylabel('Время выполнения (секунды)', fontsize=12)
-    plt.title('Зависимость времени работы алгоритма Хаффмана от размера данных', 
-              fontsize=14, weight='bold')
-    plt.grid(True, alpha=0.3)
-    plt.legend(fontsize=11)
-    plt.tight_layout()
-    plt.savefig(output_path, dpi=300, bbox_inches='tight')
-    plt.show()
-    plt.close()
+    fig = _new_figure(show, figsize=(10, 6))
+    _draw_performance_graph(fig, results)
+    _finish_figure(fig, output_path, show)
     print(f"График производительности сохранен в {output_path}")
 
 
-def plot_compression_ratio(results: List[Dict], output_path: str = "docs/compression_ratio.png"):
+def plot_compression_ratio(results: List[Dict], output_path: str = "docs/compression_ratio.png", show: bool = False):
     """
     Построение графика коэффициента сжатия.
     
     Args:
         results: Список словарей с результатами замеров
         output_path: Путь для сохранения графика
+        show: Показать ли график на экране после сохранения
     """
     dirname = os.path.dirname(output_path)
     if dirname:
         os.makedirs(dirname, exist_ok=True)
     
-    sizes = [r['text_size'] for r in results]
-    ratios = [r['compression_ratio'] for r in results]
-    
-    plt.figure(figsize=(10, 6))
-    plt.plot(sizes, ratios, 'g-s', linewidth=2, markersize=6, label='Коэффициент сжатия')
-    plt.xlabel('Размер входных данных (символов)', fontsize=12)
-    plt.ylabel('Коэффициент сжатия', fontsize=12)
-    plt.title('Эффективность сжатия алгоритмом Хаффмана', 
-              fontsize=14, weight='bold')
-    plt.grid(True, alpha=0.3)
-    plt.legend(fontsize=11)
-    plt.tight_layout()
-    plt.savefig(output_path, dpi=300, bbox_inches='tight')
-    plt.show()
-    plt.close()
+    fig = _new_figure(show, figsize=(10, 6))
+    _draw_compression_ratio(fig, results)
+    _finish_figure(fig, output_path, show)
     print(f"График коэффициента сжатия сохранен в {output_path}")
 
 
-def plot_knapsack_comparison(results: Dict, output_path: str = "docs/knapsack_comparison.png"):
+def plot_all(results: List[Dict], output_dir: str = "docs"):
+    """
+    Построение всех графиков по результатам замеров алгоритма Хаффмана.
+    
+    Графики строятся на одной фигуре, которая очищается между сохранениями,
+    вместо создания отдельной фигуры для каждого графика.
+    
+    Args:
+        results: Список словарей с результатами замеров
+        output_dir: Директория для сохранения графиков
+    """
+    os.makedirs(output_dir, exist_ok=True)
+    
+    fig = Figure(figsize=(10, 6))
+    for draw, filename, message in (
+        (_draw_performance_graph, "performance_graph.png", "График производительности"),
+        (_draw_compression_ratio, "compression_ratio.png", "График коэффициента сжатия"),
+    ):
+        fig.clf()
+        draw(fig, results)
+        output_path = os.path.join(output_dir, filename)
+        _finish_figure(fig, output_path, show=False)
+        print(f"{message} сохранен в {output_path}")
+
+
+def plot_knapsack_comparison(results: Dict, output_path: str = "docs/knapsack_comparison.png", show: bool = False):
     """
     Визуализация сравнения жадного и точного алгоритмов для рюкзака.
     
     Args:
         results: Словарь с результатами сравнения
         output_path: Путь для сохранения графика
+        show: Показать ли график на экране после сохранения
     """
     dirname = os.path.dirname(output_path)
     if dirname:
@@ -169,7 +229,8 @@ def plot_knapsack_comparison(results: Dict, output_path: str = "docs/knapsack_co
     values = [results['greedy_value'], results['exact_value']]
     times = [results['greedy_time'] * 1000, results['exact_time'] * 1000]  # в миллисекундах
     
-    fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(12, 5))
+    fig = _new_figure(show, figsize=(12, 5))
+    ax1, ax2 = fig.subplots(1, 2)
     
     # График стоимости
     bars1 = ax1.bar(algorithms, values, color=['skyblue', 'lightcoral'], edgecolor='black', linewidth=2)
@@ -195,9 +256,6 @@ def plot_knapsack_comparison(results: Dict, output_path: str = "docs/knapsack_co
         ax2.text(bar.get_x() + bar.get_width()/2., height,
                 f'{val:.4f}', ha='center', va='bottom', fontsize=11, weight='bold')
     
-    plt.tight_layout()
-    plt.savefig(output_path, dpi=300, bbox_inches='tight')
-    plt.show()
-    plt.close()
+    _finish_figure(fig, output_path, show)
     print(f"График сравнения рюкзака сохранен в {output_path}")
 
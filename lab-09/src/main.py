@@ -14,11 +14,8 @@ from src.modules.dynamic_programming import (
     fibonacci_bottom_up,
     fibonacci_memoized,
     knapsack_01_bottom_up,
-    knapsack_01_get_table,
     lcs_bottom_up,
-    lcs_get_table,
     levenshtein_distance,
-    levenshtein_get_table,
     coin_change_min_coins,
     coin_change_ways,
     longest_increasing_subsequence,
@@ -63,7 +60,7 @@ def demo_fibonacci():
     result_memo = fibonacci_memoized(n)
     result_bu = fibonacci_bottom_up(n)
     
-    print(f"  Нисходящий подход (мемоизация): {result_memo}")
+    print(f"  Нисходящий подход (быстрое удвоение): {result_memo}")
     print(f"  Восходящий подход: {result_bu}")
     print(f"  Результаты совпадают: {result_memo == result_bu}\n")
 
@@ -81,7 +78,9 @@ def demo_knapsack():
         print(f"  Предмет {i}: вес={w}, стоимость={v}")
     print(f"Вместимость рюкзака: {capacity}\n")
     
-    max_value, selected_items = knapsack_01_bottom_up(weights, values, capacity)
+    max_value, selected_items, table = knapsack_01_bottom_up(
+        weights, values, capacity, return_table=True
+    )
     
     print(f"Максимальная стоимость: {max_value}")
     print(f"Выбранные предметы (индексы): {selected_items}")
@@ -89,8 +88,7 @@ def demo_knapsack():
     for idx in selected_items:
         print(f"  Предмет {idx}: вес={weights[idx]}, стоимость={values[idx]}")
     
-    # Визуализация таблицы
-    table = knapsack_01_get_table(weights, values, capacity)
+    # Визуализация таблицы, построенной при решении
     docs_dir = ensure_docs_dir()
     visualize_knapsack_table(
         weights, values, capacity, table,
@@ -108,13 +106,12 @@ def demo_lcs():
     print(f"Строка 1: {s1}")
     print(f"Строка 2: {s2}\n")
     
-    length, lcs_string = lcs_bottom_up(s1, s2)
+    length, lcs_string, table = lcs_bottom_up(s1, s2, return_table=True)
     
     print(f"Длина LCS: {length}")
     print(f"LCS: {lcs_string}\n")
     
-    # Визуализация таблицы
-    table = lcs_get_table(s1, s2)
+    # Визуализация таблицы, построенной при решении
     docs_dir = ensure_docs_dir()
     visualize_lcs_table(s1, s2, table, save_path=str(docs_dir / 'lcs_table.png'))
 
@@ -129,12 +126,11 @@ def demo_levenshtein():
     print(f"Строка 1: {s1}")
     print(f"Строка 2: {s2}\n")
     
-    distance = levenshtein_distance(s1, s2)
+    distance, table = levenshtein_distance(s1, s2, return_table=True)
     
     print(f"Расстояние Левенштейна: {distance}\n")
     
-    # Визуализация таблицы
-    table = levenshtein_get_table(s1, s2)
+    # Визуализация таблицы, построенной при решении
     docs_dir = ensure_docs_dir()
     visualize_levenshtein_table(s1, s2, table, save_path=str(docs_dir / 'levenshtein_table.png'))
 
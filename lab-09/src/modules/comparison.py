@@ -2,36 +2,144 @@
 Модуль для сравнительного анализа различных подходов динамического программирования.
 """
 
+import gc
+import os
 import time
+from concurrent.futures import ProcessPoolExecutor
 import tracemalloc
 from typing import List, Tuple, Dict, Callable
+import numpy as np
 from src.modules.dynamic_programming import (
-    fibonacci_memoized,
+    _fibonacci_memoized_legacy,
     fibonacci_bottom_up,
     knapsack_01_bottom_up
 )
 
 
+# Зерно генератора случайных данных для воспроизводимости экспериментов
+RANDOM_SEED = 0xC0FFEE
+
+
+def _measure_memory(func: Callable, *args, **kwargs) -> Tuple[float, any]:
+    """
+    Измеряет пиковое потребление памяти функции за один вызов.
+    
+    Если трассировка уже запущена (на весь эксперимент), перед вызовом
+    сбрасывается только пик, а из результата вычитается память,
+    занятая к моменту вызова.
+    
+    Returns:
+        Tuple[память в байтах, результат функции]
+    """
+    if tracemalloc.is_tracing():
+        tracemalloc.reset_peak()
+        baseline, _ = tracemalloc.get_traced_memory()
+        result = func(*args, **kwargs)
+        current, peak = tracemalloc.get_traced_memory()
+        return peak - baseline, result
+    
+    tracemalloc.start()
+    try:
+        result = func(*args, **kwargs)
+        current, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    
+    return peak, result
+
+
+def _measure_time(func: Callable, *args, repeats: int = 7, **kwargs) -> float:
+    """
+    Измеряет время выполнения функции без трассировки памяти.
+    
+    Функция вызывается repeats раз при отключенном сборщике мусора,
+    в качестве результата берется минимальное время (как в timeit).
+    
+    Returns:
+        Время в секундах
+    """
+    timings = []
+    gc_was_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        for _ in range(repeats):
+            start_time = time.perf_counter_ns()
+            func(*args, **kwargs)
+            timings.append(time.perf_counter_ns() - start_time)
+    finally:
+        if gc_was_enabled:
+            gc.enable()
+    
+    return min(timings) / 1e9
+
+
 def measure_time_and_memory(func: Callable, *args, **kwargs) -> Tuple[float, float, any]:
     """
     Измеряет время выполнения и потребление памяти функции.
     
+    Память и время измеряются в разных проходах: tracemalloc перехватывает
+    каждое выделение памяти и сильно искажает время коротких функций.
+    
     Returns:
         Tuple[время в секундах, память в байтах, результат функции]
     """
-    tracemalloc.start()
-    start_time = time.perf_counter()
+    memory_used, result = _measure_memory(func, *args, **kwargs)
+    execution_time = _measure_time(func, *args, **kwargs)
     
-    result = func(*args, **kwargs)
+    return execution_time, memory_used, result
+
+
+def _measure_job(job: Tuple[Callable, tuple]) -> Tuple[float, float, any]:
+    """Замер одного вызова в процессе-исполнителе (tracemalloc запускается внутри него)."""
+    func, args = job
+    return measure_time_and_memory(func, *args)
+
+
+def _measure_sweep(
+    func: Callable,
+    args_list: List[tuple],
+    parallel: bool = False
+) -> Tuple[np.ndarray, np.ndarray, List[any]]:
+    """
+    Измеряет время и память функции для каждого набора аргументов из args_list.
     
-    end_time = time.perf_counter()
-    current, peak = tracemalloc.get_traced_memory()
-    tracemalloc.stop()
+    Память всех вызовов измеряется за один сеанс tracemalloc (между вызовами
+    сбрасывается только пик), затем время - отдельным проходом без трассировки.
     
-    execution_time = end_time - start_time
-    memory_used = peak
+    Args:
+        func: измеряемая функция
+        args_list: наборы позиционных аргументов
+        parallel: выполнять независимые замеры в пуле процессов. Замеры
+            идут одновременно на нескольких ядрах, поэтому время отдельных
+            вызовов может быть менее точным, чем при последовательном запуске
     
-    return execution_time, memory_used, result
+    Returns:
+        Tuple[массив времен в секундах, массив пиков памяти в байтах, список результатов]
+    """
+    count = len(args_list)
+    times = np.empty(count, dtype=np.float64)
+    memory = np.empty(count, dtype=np.int64)
+    outputs = [None] * count
+    
+    if parallel:
+        with ProcessPoolExecutor(max_workers=os.cpu_count()) as executor:
+            jobs = [(func, args) for args in args_list]
+            for k, (execution_time, memory_used, result) in enumerate(executor.map(_measure_job, jobs)):
+                times[k] = execution_time
+                memory[k] = memory_used
+                outputs[k] = result
+        return times, memory, outputs
+    
+    tracemalloc.start()
+    try:
+        for k, args in enumerate(args_list):
+            memory[k], outputs[k] = _measure_memory(func, *args)
+    finally:
+        tracemalloc.stop()
+    
+    for k, args in enumerate(args_list):
+        times[k] = _measure_time(func, *args)
+    return times, memory, outputs
 
 
 def compare_fibonacci_approaches(max_n: int = 40, step: int = 5) -> Dict:
@@ -45,38 +153,35 @@ def compare_fibonacci_approaches(max_n: int = 40, step: int = 5) -> Dict:
     Returns:
         Словарь с результатами сравнения
     """
+    n_values = np.arange(step, max_n + 1, step, dtype=np.int32)
+    args_list = [(n,) for n in n_values.tolist()]
+    
+    # Нисходящий подход с мемоизацией
+    memoized_time, memoized_memory, memoized_results = _measure_sweep(
+        _fibonacci_memoized_legacy, args_list
+    )
+    # Восходящий подход
+    bottom_up_time, bottom_up_memory, bottom_up_results = _measure_sweep(
+        fibonacci_bottom_up, args_list
+    )
+    
+    # Проверка корректности (один раз после всех замеров)
+    mismatches = [
+        n for n, result_memo, result_bu in zip(n_values.tolist(), memoized_results, bottom_up_results)
+        if result_memo != result_bu
+    ]
+    assert not mismatches, f"Результаты не совпадают для n={mismatches}"
+    
     results = {
-        'n_values': [],
-        'memoized_time': [],
-        'memoized_memory': [],
-        'bottom_up_time': [],
-        'bottom_up_memory': [],
-        'memoized_results': [],
-        'bottom_up_results': []
+        'n_values': n_values,
+        'memoized_time': memoized_time,
+        'memoized_memory': memoized_memory,
+        'bottom_up_time': bottom_up_time,
+        'bottom_up_memory': bottom_up_memory,
+        'memoized_results': memoized_results,
+        'bottom_up_results': bottom_up_results
     }
     
-    for n in range(step, max_n + 1, step):
-        results['n_values'].append(n)
-        
-        # Нисходящий подход с мемоизацией
-        time_memo, mem_memo, result_memo = measure_time_and_memory(
-            fibonacci_memoized, n
-        )
-        results['memoized_time'].append(time_memo)
-        results['memoized_memory'].append(mem_memo)
-        results['memoized_results'].append(result_memo)
-        
-        # Восходящий подход
-        time_bu, mem_bu, result_bu = measure_time_and_memory(
-            fibonacci_bottom_up, n
-        )
-        results['bottom_up_time'].append(time_bu)
-        results['bottom_up_memory'].append(mem_bu)
-        results['bottom_up_results'].append(result_bu)
-        
-        # Проверка корректности
-        assert result_memo == result_bu, f"Результаты не совпадают для n={n}"
-    
     return results
 
 
@@ -87,29 +192,31 @@ def greedy_knapsack_continuous(weights: List[int], values: List[int], capacity:
     Returns:
         Максимальная стоимость
     """
+    w = np.asarray(weights, dtype=np.float64)
+    v = np.asarray(values, dtype=np.float64)
+    ratio = v / w
     # Сортируем по убыванию отношения стоимость/вес
-    items = [(values[i] / weights[i], weights[i], values[i], i) 
-             for i in range(len(weights))]
-    items.sort(reverse=True)
+    order = np.argsort(-ratio, kind='stable')
     
     total_value = 0.0
     remaining_capacity = capacity
     
-    for ratio, weight, value, _ in items:
-        if remaining_capacity >= weight:
-            total_value += value
-            remaining_capacity -= weight
+    for idx in order.tolist():
+        if remaining_capacity >= w[idx]:
+            total_value += v[idx]
+            remaining_capacity -= w[idx]
         else:
-            total_value += ratio * remaining_capacity
+            total_value += ratio[idx] * remaining_capacity
             break
     
-    return total_value
+    return float(total_value)
 
 
 def compare_knapsack_approaches(
     num_items: int = 10,
     capacity: int = 50,
-    num_tests: int = 5
+    num_tests: int = 5,
+    parallel: bool = False
 ) -> Dict:
     """
     Сравнение жадного алгоритма для непрерывного рюкзака с ДП для 0-1 рюкзака.
@@ -118,52 +225,43 @@ def compare_knapsack_approaches(
         num_items: количество предметов
         capacity: вместимость рюкзака
         num_tests: количество тестов
+        parallel: выполнять независимые тесты в пуле процессов
     
     Returns:
         Словарь с результатами сравнения
     """
-    import random
+    # Все входные данные генерируются заранее, вне измеряемых вызовов
+    rng = np.random.default_rng(RANDOM_SEED)
+    all_weights = rng.integers(1, 21, size=(num_tests, num_items))
+    all_values = rng.integers(10, 101, size=(num_tests, num_items))
+    
+    weights_list = all_weights.tolist()
+    values_list = all_values.tolist()
+    args_list = [(weights, values, capacity) for weights, values in zip(weights_list, values_list)]
+    
+    # ДП для 0-1 рюкзака
+    dp_time, _, dp_outputs = _measure_sweep(knapsack_01_bottom_up, args_list, parallel)
+    # Жадный алгоритм для непрерывного рюкзака
+    greedy_time, _, greedy_value = _measure_sweep(greedy_knapsack_continuous, args_list, parallel)
     
     results = {
-        'test_num': [],
-        'dp_value': [],
-        'greedy_value': [],
-        'dp_time': [],
-        'greedy_time': [],
-        'weights': [],
-        'values': []
+        'test_num': np.arange(1, num_tests + 1, dtype=np.int32),
+        'dp_value': np.array([dp_value for dp_value, _ in dp_outputs], dtype=np.int64),
+        'greedy_value': np.array(greedy_value, dtype=np.float64),
+        'dp_time': dp_time,
+        'greedy_time': greedy_time,
+        'weights': weights_list,
+        'values': values_list
     }
     
-    for test in range(num_tests):
-        # Генерируем случайные веса и стоимости
-        weights = [random.randint(1, 20) for _ in range(num_items)]
-        values = [random.randint(10, 100) for _ in range(num_items)]
-        
-        results['test_num'].append(test + 1)
-        results['weights'].append(weights.copy())
-        results['values'].append(values.copy())
-        
-        # ДП для 0-1 рюкзака
-        time_dp, _, (dp_value, _) = measure_time_and_memory(
-            knapsack_01_bottom_up, weights, values, capacity
-        )
-        results['dp_value'].append(dp_value)
-        results['dp_time'].append(time_dp)
-        
-        # Жадный алгоритм для непрерывного рюкзака
-        time_greedy, _, greedy_value = measure_time_and_memory(
-            greedy_knapsack_continuous, weights, values, capacity
-        )
-        results['greedy_value'].append(greedy_value)
-        results['greedy_time'].append(time_greedy)
-    
     return results
 
 
 def analyze_knapsack_scalability(
     max_items: int = 50,
     step: int = 5,
-    capacity: int = 100
+    capacity: int = 100,
+    parallel: bool = False
 ) -> Dict:
     """
     Анализ масштабируемости алгоритма рюкзака при увеличении размера входных данных.
@@ -172,32 +270,27 @@ def analyze_knapsack_scalability(
         max_items: максимальное количество предметов
         step: шаг для количества предметов
         capacity: вместимость рюкзака
+        parallel: выполнять замеры для разных n в пуле процессов
     
     Returns:
         Словарь с результатами анализа
     """
-    import random
+    # Входные данные генерируются один раз: набор для n предметов является
+    # префиксом набора для большего n, поэтому точки кривой сравнимы между собой
+    rng = np.random.default_rng(RANDOM_SEED)
+    all_weights = rng.integers(1, 21, size=max_items)
+    all_values = rng.integers(10, 101, size=max_items)
+    
+    num_items = np.arange(step, max_items + 1, step, dtype=np.int32)
+    args_list = [(all_weights[:n].tolist(), all_values[:n].tolist(), capacity) for n in num_items]
+    
+    execution_time, memory_used, outputs = _measure_sweep(knapsack_01_bottom_up, args_list, parallel)
     
     results = {
-        'num_items': [],
-        'execution_time': [],
-        'memory_used': [],
-        'max_value': []
+        'num_items': num_items,
+        'execution_time': execution_time,
+        'memory_used': memory_used,
+        'max_value': np.array([max_val for max_val, _ in outputs], dtype=np.int64)
     }
     
-    for n in range(step, max_items + 1, step):
-        # Генерируем случайные данные
-        weights = [random.randint(1, 20) for _ in range(n)]
-        values = [random.randint(10, 100) for _ in range(n)]
-        
-        time_exec, mem_used, (max_val, _) = measure_time_and_memory(
-            knapsack_01_bottom_up, weights, values, capacity
-        )
-        
-        results['num_items'].append(n)
-        results['execution_time'].append(time_exec)
-        results['memory_used'].append(mem_used)
-        results['max_value'].append(max_val)
-    
     return results
-
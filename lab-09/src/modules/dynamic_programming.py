@@ -3,7 +3,21 @@
 """
 
 from functools import lru_cache
-from typing import List, Tuple, Dict, Optional
+from math import comb
+from typing import List, Tuple, Dict, Optional, Union
+import numpy as np
+
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    # numba не обязательна: без неё используются реализации на чистом Python
+    NUMBA_AVAILABLE = False
+    
+    def njit(*args, **kwargs):
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda func: func
 
 
 # ==================== ЧИСЛА ФИБОНАЧЧИ ====================
@@ -20,9 +34,36 @@ def fibonacci_naive(n: int) -> int:
     return fibonacci_naive(n - 1) + fibonacci_naive(n - 2)
 
 
-def fibonacci_memoized(n: int, memo: Optional[Dict[int, int]] = None) -> int:
+def fibonacci_memoized(n: int) -> int:
     """
-    Рекурсивная реализация с мемоизацией (нисходящий подход).
+    Рекурсивная реализация по формулам быстрого удвоения (нисходящий подход).
+    
+    F(2k) = F(k) * (2F(k+1) - F(k)), F(2k+1) = F(k)^2 + F(k+1)^2,
+    поэтому на каждом уровне рекурсии n уменьшается вдвое и мемоизация
+    промежуточных значений не требуется.
+    
+    Временная сложность: O(log n) умножений
+    Пространственная сложность: O(log n) (глубина стека)
+    """
+    def doubling(k: int) -> Tuple[int, int]:
+        # Возвращает пару (F(k), F(k+1))
+        if k == 0:
+            return 0, 1
+        a, b = doubling(k >> 1)
+        c = a * ((b << 1) - a)
+        d = a * a + b * b
+        if k & 1:
+            return d, c + d
+        return c, d
+    
+    return doubling(n)[0]
+
+
+def _fibonacci_memoized_legacy(n: int, memo: Optional[Dict[int, int]] = None) -> int:
+    """
+    Рекурсивная реализация с мемоизацией в словаре.
+    
+    Сохранена для сравнительного анализа стоимости мемоизации.
     
     Временная сложность: O(n)
     Пространственная сложность: O(n)
@@ -33,7 +74,7 @@ def fibonacci_memoized(n: int, memo: Optional[Dict[int, int]] = None) -> int:
         return memo[n]
     if n <= 1:
         return n
-    memo[n] = fibonacci_memoized(n - 1, memo) + fibonacci_memoized(n - 2, memo)
+    memo[n] = _fibonacci_memoized_legacy(n - 1, memo) + _fibonacci_memoized_legacy(n - 2, memo)
     return memo[n]
 
 
@@ -67,7 +108,12 @@ def fibonacci_bottom_up(n: int) -> int:
 
 # ==================== ЗАДАЧА О РЮКЗАКЕ (0-1 KNAPSACK) ====================
 
-def knapsack_01_bottom_up(weights: List[int], values: List[int], capacity: int) -> Tuple[int, List[int]]:
+def knapsack_01_bottom_up(
+    weights: List[int],
+    values: List[int],
+    capacity: int,
+    return_table: bool = False
+) -> Union[Tuple[int, List[int]], Tuple[int, List[int], np.ndarray]]:
     """
     Решение задачи о рюкзаке 0-1 восходящим подходом.
     
@@ -75,77 +121,162 @@ def knapsack_01_bottom_up(weights: List[int], values: List[int], capacity: int)
         weights: веса предметов
         values: стоимости предметов
         capacity: вместимость рюкзака
+        return_table: вернуть также полную таблицу ДП (для визуализации)
     
     Returns:
-        Tuple[максимальная стоимость, список индексов выбранных предметов]
+        Tuple[максимальная стоимость, список индексов выбранных предметов],
+        при return_table=True третьим элементом - таблица ДП в виде массива
+        NumPy размера (n + 1) x (W + 1); визуализация принимает его без
+        преобразования
     
     Временная сложность: O(n * W), где n - количество предметов, W - вместимость
-    Пространственная сложность: O(n * W)
+    Пространственная сложность: O(n * W) бит для восстановления решения
     """
     n = len(weights)
-    # dp[i][w] - максимальная стоимость для первых i предметов с вместимостью w
-    dp = [[0 for _ in range(capacity + 1)] for _ in range(n + 1)]
+    # Стоимость любого набора не превосходит суммы всех стоимостей; если она
+    # помещается в int32, строка ДП занимает вдвое меньше памяти, чем в int64
+    dtype = np.int32 if sum(values) < 2 ** 31 else np.int64
+    weights_arr = np.asarray(weights, dtype=np.int64)
+    values_arr = np.asarray(values, dtype=dtype)
+    # dp[w] - максимальная стоимость для уже рассмотренных предметов с вместимостью w;
+    # строка таблицы обновляется на месте векторной операцией NumPy
+    dp = np.zeros(capacity + 1, dtype=dtype)
+    # keep[i][w] - взят ли предмет i в оптимальном решении с вместимостью w
+    keep = np.zeros((n, capacity + 1), dtype=bool)
+    # table[i][w] - максимальная стоимость для первых i предметов с вместимостью w
+    table = np.zeros((n + 1, capacity + 1), dtype=dtype) if return_table else None
     
-    # Заполняем таблицу
-    for i in range(1, n + 1):
-        for w in range(capacity + 1):
-            # Не берем предмет i
-            dp[i][w] = dp[i - 1][w]
-            # Пытаемся взять предмет i
-            if weights[i - 1] <= w:
-                dp[i][w] = max(dp[i][w], dp[i - 1][w - weights[i - 1]] + values[i - 1])
+    for i in range(n):
+        weight = int(weights_arr[i])
+        if weight <= capacity:
+            # Кандидаты считаются по значениям предыдущей строки (копия до обновления)
+            candidates = dp[:capacity + 1 - weight] + values_arr[i]
+            better = candidates > dp[weight:]
+            dp[weight:][better] = candidates[better]
+            keep[i, weight:][better] = True
+        if return_table:
+            table[i + 1] = dp
     
     # Восстановление решения
     selected_items = []
     w = capacity
-    for i in range(n, 0, -1):
-        if dp[i][w] != dp[i - 1][w]:
-            selected_items.append(i - 1)
-            w -= weights[i - 1]
+    for i in range(n - 1, -1, -1):
+        if keep[i, w]:
+            selected_items.append(i)
+            w -= weights[i]
     
     selected_items.reverse()
-    return dp[n][capacity], selected_items
+    if return_table:
+        return int(dp[capacity]), selected_items, table
+    return int(dp[capacity]), selected_items
 
 
-def knapsack_01_get_table(weights: List[int], values: List[int], capacity: int) -> List[List[int]]:
+def knapsack_01_get_table(weights: List[int], values: List[int], capacity: int) -> np.ndarray:
     """
-    Получить таблицу ДП для задачи о рюкзаке (для визуализации).
+    Получить таблицу ДП для задачи о рюкзаке (для визуализации) в виде массива NumPy.
     """
-    n = len(weights)
-    dp = [[0 for _ in range(capacity + 1)] for _ in range(n + 1)]
-    
-    for i in range(1, n + 1):
-        for w in range(capacity + 1):
-            dp[i][w] = dp[i - 1][w]
-            if weights[i - 1] <= w:
-                dp[i][w] = max(dp[i][w], dp[i - 1][w - weights[i - 1]] + values[i - 1])
+    return knapsack_01_bottom_up(weights, values, capacity, return_table=True)[2]
+
+
+# ==================== СРАВНЕНИЕ СТРОК ====================
+
+def _as_code_points(s: str) -> np.ndarray:
+    """Массив кодов символов строки (UTF-32), по одному элементу на символ."""
+    return np.frombuffer(s.encode('utf-32-le'), dtype=np.uint32)
+
+
+def _match_rows(s1: str, s2: str):
+    """
+    Для каждого символа s1 - список флагов его совпадения с символами s2.
     
-    return dp
+    Строка флагов вычисляется одним векторным сравнением NumPy по кодам
+    символов, поэтому во внутреннем цикле ДП вместо сравнения строк Python
+    выполняется только чтение элемента списка.
+    """
+    codes = _as_code_points(s2)
+    for code in _as_code_points(s1).tolist():
+        yield (codes == code).tolist()
 
 
 # ==================== НАИБОЛЬШАЯ ОБЩАЯ ПОДПОСЛЕДОВАТЕЛЬНОСТЬ (LCS) ====================
 
-def lcs_bottom_up(s1: str, s2: str) -> Tuple[int, str]:
+def _lcs_length_row(s1: str, s2: str) -> List[int]:
+    """
+    Последняя строка таблицы ДП для LCS: элемент j - длина LCS для s1 и s2[0:j].
+    
+    Хранятся только две строки таблицы, которые меняются местами.
+    """
+    n = len(s2)
+    prev = [0] * (n + 1)
+    cur = [0] * (n + 1)
+    for matches in _match_rows(s1, s2):
+        for j, same in enumerate(matches, 1):
+            if same:
+                cur[j] = prev[j - 1] + 1
+            elif prev[j] > cur[j - 1]:
+                cur[j] = prev[j]
+            else:
+                cur[j] = cur[j - 1]
+        prev, cur = cur, prev
+    return prev
+
+
+def _lcs_hirschberg(s1: str, s2: str) -> str:
+    """
+    Восстановление LCS алгоритмом Хиршберга (разделяй и властвуй).
+    
+    s1 делится пополам; прямой проход для первой половины и обратный
+    для второй дают точку разбиения s2, через которую проходит оптимальный путь.
+    """
+    if not s1 or not s2:
+        return ''
+    if len(s1) == 1:
+        return s1 if s1 in s2 else ''
+    
+    mid = len(s1) // 2
+    forward = _lcs_length_row(s1[:mid], s2)
+    backward = _lcs_length_row(s1[mid:][::-1], s2[::-1])
+    n = len(s2)
+    split = max(range(n + 1), key=lambda j: forward[j] + backward[n - j])
+    return _lcs_hirschberg(s1[:mid], s2[:split]) + _lcs_hirschberg(s1[mid:], s2[split:])
+
+
+def lcs_bottom_up(
+    s1: str,
+    s2: str,
+    return_table: bool = False
+) -> Union[Tuple[int, str], Tuple[int, str, List[List[int]]]]:
     """
     Нахождение наибольшей общей подпоследовательности восходящим подходом.
     
+    Без return_table таблица ДП заполняется построчно с хранением только
+    двух строк, а сама подпоследовательность восстанавливается алгоритмом
+    Хиршберга. С return_table строится полная таблица, и подпоследовательность
+    восстанавливается по ней.
+    
     Args:
         s1, s2: входные строки
+        return_table: вернуть также полную таблицу ДП (для визуализации)
     
     Returns:
-        Tuple[длина LCS, сама подпоследовательность]
+        Tuple[длина LCS, сама подпоследовательность],
+        при return_table=True третьим элементом - таблица ДП
     
     Временная сложность: O(m * n), где m и n - длины строк
-    Пространственная сложность: O(m * n)
+    Пространственная сложность: O(m + n), с return_table - O(m * n)
     """
+    if not return_table:
+        lcs_string = _lcs_hirschberg(s1, s2)
+        return len(lcs_string), lcs_string
+    
     m, n = len(s1), len(s2)
     # dp[i][j] - длина LCS для s1[0:i] и s2[0:j]
     dp = [[0 for _ in range(n + 1)] for _ in range(m + 1)]
     
     # Заполняем таблицу
-    for i in range(1, m + 1):
-        for j in range(1, n + 1):
-            if s1[i - 1] == s2[j - 1]:
+    for i, matches in enumerate(_match_rows(s1, s2), 1):
+        for j, same in enumerate(matches, 1):
+            if same:
                 dp[i][j] = dp[i - 1][j - 1] + 1
             else:
                 dp[i][j] = max(dp[i - 1][j], dp[i][j - 1])
@@ -164,41 +295,168 @@ def lcs_bottom_up(s1: str, s2: str) -> Tuple[int, str]:
             j -= 1
     
     lcs_string.reverse()
-    return dp[m][n], ''.join(lcs_string)
+    return dp[m][n], ''.join(lcs_string), dp
 
 
 def lcs_get_table(s1: str, s2: str) -> List[List[int]]:
     """
     Получить таблицу ДП для LCS (для визуализации).
     """
-    m, n = len(s1), len(s2)
-    dp = [[0 for _ in range(n + 1)] for _ in range(m + 1)]
+    return lcs_bottom_up(s1, s2, return_table=True)[2]
+
+
+# ==================== РАССТОЯНИЕ ЛЕВЕНШТЕЙНА ====================
+
+@njit(cache=True, boundscheck=False)
+def _levenshtein_core(a, b):
+    """
+    Расстояние Левенштейна между массивами кодов символов, компилируемое numba.
     
+    Хранятся только две строки таблицы ДП: предыдущая и текущая.
+    """
+    m, n = a.size, b.size
+    prev = np.arange(n + 1).astype(np.int32)
+    cur = np.empty_like(prev)
     for i in range(1, m + 1):
+        cur[0] = i
         for j in range(1, n + 1):
-            if s1[i - 1] == s2[j - 1]:
-                dp[i][j] = dp[i - 1][j - 1] + 1
-            else:
-                dp[i][j] = max(dp[i - 1][j], dp[i][j - 1])
-    
-    return dp
+            cost = 0 if a[i - 1] == b[j - 1] else 1
+            cur[j] = min(prev[j] + 1, cur[j - 1] + 1, prev[j - 1] + cost)
+        prev, cur = cur, prev
+    return prev[n]
 
 
-# ==================== РАССТОЯНИЕ ЛЕВЕНШТЕЙНА ====================
+# Максимальная длина более короткой строки для скомпилированного алгоритма
+# Майерса: столбец таблицы ДП помещается в одно 64-битное машинное слово
+MYERS_MAX_PATTERN_LENGTH = 64
+
 
-def levenshtein_distance(s1: str, s2: str) -> int:
+@njit(cache=True)
+def _levenshtein_myers_core(text, pattern):
+    """
+    Алгоритм Майерса над массивами кодов символов, компилируемый numba.
+    
+    Столбец таблицы ДП хранится в одном слове uint64, поэтому длина pattern
+    должна быть от 1 до MYERS_MAX_PATTERN_LENGTH. Битовые маски символов
+    хранятся по отсортированному алфавиту pattern и ищутся бинарным поиском.
+    Биты старше длины pattern не влияют на младшие, поэтому маскировать
+    векторы не требуется.
+    """
+    m = pattern.size
+    one = np.uint64(1)
+    alphabet = np.unique(pattern)
+    peq = np.zeros(alphabet.size, dtype=np.uint64)
+    for j in range(m):
+        peq[np.searchsorted(alphabet, pattern[j])] |= one << np.uint64(j)
+    
+    last_bit = one << np.uint64(m - 1)
+    vp = ~np.uint64(0)
+    vn = np.uint64(0)
+    score = m
+    for i in range(text.size):
+        k = np.searchsorted(alphabet, text[i])
+        if k < alphabet.size and alphabet[k] == text[i]:
+            eq = peq[k]
+        else:
+            eq = np.uint64(0)
+        xv = eq | vn
+        xh = (((eq & vp) + vp) ^ vp) | eq
+        hp = vn | ~(xh | vp)
+        hn = vp & xh
+        if hp & last_bit:
+            score += 1
+        elif hn & last_bit:
+            score -= 1
+        hp = (hp << one) | one
+        hn = hn << one
+        vp = hn | ~(xv | hp)
+        vn = hp & xv
+    return score
+
+
+def _levenshtein_myers(text: str, pattern: str) -> int:
+    """
+    Битово-параллельный алгоритм Майерса (в формулировке Хюрё) для расстояния Левенштейна.
+    
+    Столбец таблицы ДП хранится как битовые векторы положительных (VP)
+    и отрицательных (VN) разностей соседних клеток, поэтому обработка одного
+    символа text сводится к нескольким битовым операциям над целыми.
+    Целые Python не ограничены по длине, поэтому pattern может быть любой длины.
+    
+    Временная сложность: O(len(text) * ceil(len(pattern) / 64))
+    Пространственная сложность: O(σ), σ - число различных символов pattern
+    """
+    m = len(pattern)
+    if m == 0:
+        return len(text)
+    
+    # peq[c] - битовая маска позиций символа c в pattern
+    peq = {}
+    for j, char in enumerate(pattern):
+        peq[char] = peq.get(char, 0) | (1 << j)
+    
+    full_mask = (1 << m) - 1
+    last_bit = 1 << (m - 1)
+    vp, vn = full_mask, 0
+    score = m
+    for char in text:
+        eq = peq.get(char, 0)
+        xv = eq | vn
+        xh = (((eq & vp) + vp) ^ vp) | eq
+        hp = (vn | ~(xh | vp)) & full_mask
+        hn = vp & xh
+        if hp & last_bit:
+            score += 1
+        elif hn & last_bit:
+            score -= 1
+        # Сдвиг с единицей: первая строка таблицы ДП равна 0, 1, 2, ...
+        hp = (hp << 1) | 1
+        hn <<= 1
+        vp = (hn | ~(xv | hp)) & full_mask
+        vn = hp & xv & full_mask
+    return score
+
+
+def levenshtein_distance(
+    s1: str,
+    s2: str,
+    return_table: bool = False
+) -> Union[int, Tuple[int, List[List[int]]]]:
     """
     Вычисление расстояния Левенштейна (редакционного расстояния).
     
+    При наличии numba для более короткой строки не длиннее
+    MYERS_MAX_PATTERN_LENGTH символов используется скомпилированный
+    битово-параллельный алгоритм Майерса над одним 64-битным словом,
+    для более длинных строк - скомпилированное заполнение таблицы
+    с двумя строками ДП. Без numba алгоритм Майерса выполняется над целыми
+    Python для строк любой длины. С return_table всегда строится полная таблица.
+    
     Args:
         s1, s2: входные строки
+        return_table: вернуть также полную таблицу ДП (для визуализации)
     
     Returns:
-        Минимальное количество операций для преобразования s1 в s2
+        Минимальное количество операций для преобразования s1 в s2,
+        при return_table=True - Tuple[расстояние, таблица ДП]
     
-    Временная сложность: O(m * n)
-    Пространственная сложность: O(m * n)
+    Временная сложность: O(m * n), для алгоритма Майерса O(m * ceil(n / 64))
+    Пространственная сложность: O(m + n), с return_table - O(m * n)
     """
+    if not return_table:
+        # Расстояние симметрично: более короткая строка используется как pattern
+        if len(s1) < len(s2):
+            s1, s2 = s2, s1
+        if not s2:
+            return len(s1)
+        if not NUMBA_AVAILABLE:
+            return _levenshtein_myers(s1, s2)
+        
+        text, pattern = _as_code_points(s1), _as_code_points(s2)
+        if pattern.size <= MYERS_MAX_PATTERN_LENGTH:
+            return int(_levenshtein_myers_core(text, pattern))
+        return int(_levenshtein_core(text, pattern))
+    
     m, n = len(s1), len(s2)
     # dp[i][j] - расстояние между s1[0:i] и s2[0:j]
     dp = [[0 for _ in range(n + 1)] for _ in range(m + 1)]
@@ -210,9 +468,9 @@ def levenshtein_distance(s1: str, s2: str) -> int:
         dp[0][j] = j
     
     # Заполняем таблицу
-    for i in range(1, m + 1):
-        for j in range(1, n + 1):
-            if s1[i - 1] == s2[j - 1]:
+    for i, matches in enumerate(_match_rows(s1, s2), 1):
+        for j, same in enumerate(matches, 1):
+            if same:
                 dp[i][j] = dp[i - 1][j - 1]
             else:
                 dp[i][j] = 1 + min(
@@ -221,41 +479,40 @@ def levenshtein_distance(s1: str, s2: str) -> int:
                     dp[i - 1][j - 1]   # замена
                 )
     
-    return dp[m][n]
+    return dp[m][n], dp
 
 
 def levenshtein_get_table(s1: str, s2: str) -> List[List[int]]:
     """
     Получить таблицу ДП для расстояния Левенштейна (для визуализации).
     """
-    m, n = len(s1), len(s2)
-    dp = [[0 for _ in range(n + 1)] for _ in range(m + 1)]
-    
-    for i in range(m + 1):
-        dp[i][0] = i
-    for j in range(n + 1):
-        dp[0][j] = j
-    
-    for i in range(1, m + 1):
-        for j in range(1, n + 1):
-            if s1[i - 1] == s2[j - 1]:
-                dp[i][j] = dp[i - 1][j - 1]
-            else:
-                dp[i][j] = 1 + min(
-                    dp[i - 1][j],
-                    dp[i][j - 1],
-                    dp[i - 1][j - 1]
-                )
-    
-    return dp
+    return levenshtein_distance(s1, s2, return_table=True)[1]
 
 
 # ==================== РАЗМЕН МОНЕТ ====================
 
+def _residue_blocks(dp: np.ndarray, coin: int, fill) -> np.ndarray:
+    """
+    Матрица из dp, дополненного значением fill до длины, кратной coin.
+    
+    Столбец r матрицы - элементы dp с индексами r, r + coin, r + 2*coin, ...
+    Переход dp[i] <- dp[i - coin] связывает только соседние элементы одного
+    столбца, поэтому проход по сумме сводится к накоплению вдоль axis=0.
+    """
+    rows = -(-dp.size // coin)
+    padded = np.full(rows * coin, fill, dtype=dp.dtype)
+    padded[:dp.size] = dp
+    return padded.reshape(rows, coin)
+
+
 def coin_change_min_coins(coins: List[int], amount: int) -> int:
     """
     Минимальное количество монет для размена суммы.
     
+    Проход по суммам для каждой монеты выполняется векторно: в каждом
+    столбце остатков dp[k] = min(dp[k], dp[k-1] + 1) эквивалентно
+    накопленному минимуму величин dp[k] - k.
+    
     Args:
         coins: номиналы монет
         amount: сумма для размена
@@ -266,21 +523,30 @@ def coin_change_min_coins(coins: List[int], amount: int) -> int:
     Временная сложность: O(amount * len(coins))
     Пространственная сложность: O(amount)
     """
-    # dp[i] - минимальное количество монет для суммы i
-    dp = [float('inf')] * (amount + 1)
+    # dp[i] - минимальное количество монет для суммы i;
+    # amount + 1 монет не требуется ни для одной достижимой суммы
+    unreachable = amount + 1
+    dp = np.full(amount + 1, unreachable, dtype=np.int64)
     dp[0] = 0
     
     for coin in coins:
-        for i in range(coin, amount + 1):
-            dp[i] = min(dp[i], dp[i - coin] + 1)
+        if coin <= 0 or coin > amount:
+            continue
+        blocks = _residue_blocks(dp, coin, unreachable)
+        steps = np.arange(blocks.shape[0], dtype=np.int64)[:, None]
+        blocks = np.minimum.accumulate(blocks - steps, axis=0) + steps
+        dp = blocks.ravel()[:amount + 1]
     
-    return dp[amount] if dp[amount] != float('inf') else -1
+    return int(dp[amount]) if dp[amount] < unreachable else -1
 
 
 def coin_change_ways(coins: List[int], amount: int) -> int:
     """
     Количество способов размена суммы.
     
+    Проход по суммам для каждой монеты выполняется векторно: в каждом
+    столбце остатков dp[k] += dp[k-1] - это накопленная сумма.
+    
     Args:
         coins: номиналы монет
         amount: сумма для размена
@@ -291,14 +557,24 @@ def coin_change_ways(coins: List[int], amount: int) -> int:
     Временная сложность: O(amount * len(coins))
     Пространственная сложность: O(amount)
     """
-    dp = [0] * (amount + 1)
+    coins = [coin for coin in coins if coin > 0]
+    # Число способов не превосходит числа мультимножеств из len(coins) номиналов
+    # размера не больше amount; если оно не помещается в int64, считаем
+    # в целых числах Python (массив dtype=object)
+    if comb(amount + len(coins), len(coins)) < 2 ** 63:
+        dtype = np.int64
+    else:
+        dtype = object
+    dp = np.zeros(amount + 1, dtype=dtype)
     dp[0] = 1
     
     for coin in coins:
-        for i in range(coin, amount + 1):
-            dp[i] += dp[i - coin]
+        if coin > amount:
+            continue
+        blocks = np.cumsum(_residue_blocks(dp, coin, 0), axis=0)
+        dp = blocks.ravel()[:amount + 1]
     
-    return dp[amount]
+    return int(dp[amount])
 
 
 # ==================== НАИБОЛЬШАЯ ВОЗРАСТАЮЩАЯ ПОДПОСЛЕДОВАТЕЛЬНОСТЬ (LIS) ====================
@@ -324,16 +600,16 @@ def longest_increasing_subsequence(arr: List[int]) -> Tuple[int, List[int]]:
     dp = [1] * n
     # parent[i] - индекс предыдущего элемента в LIS
     parent = [-1] * n
+    # Максимальная длина и первый индекс, на котором она достигается
+    max_len, max_idx = 1, 0
     
     for i in range(1, n):
         for j in range(i):
             if arr[j] < arr[i] and dp[j] + 1 > dp[i]:
                 dp[i] = dp[j] + 1
                 parent[i] = j
-    
-    # Находим максимальную длину и её индекс
-    max_len = max(dp)
-    max_idx = dp.index(max_len)
+        if dp[i] > max_len:
+            max_len, max_idx = dp[i], i
     
     # Восстановление подпоследовательности
     lis = []
@@ -346,10 +622,46 @@ def longest_increasing_subsequence(arr: List[int]) -> Tuple[int, List[int]]:
     return max_len, lis
 
 
+@njit(cache=True)
+def _lis_nlogn_core(arr):
+    """
+    Основной цикл LIS за O(n * log(n)), компилируемый numba.
+    
+    Returns:
+        Кортеж (длина LIS, индекс последнего элемента LIS, массив parent)
+    """
+    n = arr.size
+    # tail[k] - индекс наименьшего последнего элемента LIS длины k+1
+    tail = np.empty(n, dtype=np.int64)
+    parent = np.full(n, -1, dtype=np.int64)
+    tail_len = 0
+    
+    for i in range(n):
+        x = arr[i]
+        # Бинарный поиск первой позиции, где arr[tail[pos]] >= x
+        left, right = 0, tail_len
+        while left < right:
+            mid = (left + right) >> 1
+            if arr[tail[mid]] < x:
+                left = mid + 1
+            else:
+                right = mid
+        tail[left] = i
+        if left == tail_len:
+            tail_len += 1
+        if left > 0:
+            parent[i] = tail[left - 1]
+    
+    return tail_len, tail[tail_len - 1], parent
+
+
 def longest_increasing_subsequence_optimized(arr: List[int]) -> Tuple[int, List[int]]:
     """
     Оптимизированная версия LIS с бинарным поиском.
     
+    При наличии numba основной цикл выполняется скомпилированной функцией
+    над массивом NumPy.
+    
     Временная сложность: O(n * log(n))
     Пространственная сложность: O(n)
     """
@@ -357,6 +669,17 @@ def longest_increasing_subsequence_optimized(arr: List[int]) -> Tuple[int, List[
     if n == 0:
         return 0, []
     
+    if NUMBA_AVAILABLE:
+        values = np.asarray(arr)
+        if values.dtype.kind in 'iuf':
+            max_len, idx, parent = _lis_nlogn_core(values)
+            lis = []
+            while idx != -1:
+                lis.append(arr[idx])
+                idx = parent[idx]
+            lis.reverse()
+            return int(max_len), lis
+    
     # tail[i] - наименьший последний элемент LIS длины i+1
     tail = []
     # parent[i] - индекс предыдущего элемента
@@ -2,197 +2,484 @@
 Модуль для визуализации таблиц динамического программирования и графиков производительности.
 """
 
+import matplotlib
 import matplotlib.pyplot as plt
+from matplotlib.cm import ScalarMappable
+from matplotlib.colors import Normalize
+from matplotlib.font_manager import FontProperties
+from mpl_toolkits.axes_grid1 import make_axes_locatable
 import numpy as np
-from typing import List, Dict
+from functools import lru_cache
+from typing import List, Dict, Optional, Tuple, Union
+import hashlib
 import os
 
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    # numba не обязательна: без неё используются реализации на чистом Python
+    NUMBA_AVAILABLE = False
+    
+    def njit(*args, **kwargs):
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda func: func
+
+
+# Разрешение сохраняемых изображений по умолчанию; для печати можно передать 300
+DEFAULT_DPI = 150
+
+# Максимальное число ячеек таблицы, при котором в них выводятся значения:
+# на больших таблицах подписи все равно нечитаемы
+ANNOTATION_MAX_CELLS = 2500
+
+# Максимальное число отображаемых столбцов таблицы рюкзака
+KNAPSACK_MAX_COLUMNS = 40
+
+# Максимальное число отображаемых строк и столбцов тепловой карты: большие
+# таблицы прореживаются до передачи в imshow
+HEATMAP_MAX_CELLS = 500
+
+# Палитры тепловых карт создаются один раз при загрузке модуля; пробный
+# вызов сразу строит таблицу цветов, чтобы она не пересчитывалась на каждом графике
+_CMAPS = {name: plt.get_cmap(name) for name in ('YlOrRd', 'Blues', 'Reds')}
+for _cmap in _CMAPS.values():
+    _cmap(0.0)
+# Общий полужирный шрифт подписей ячеек LCS и Левенштейна: свойства шрифта
+# задаются одним объектом, а не разбираются заново для каждой подписи
+_FP_BOLD = FontProperties(weight='bold', size=10)
+
+
+# Интерактивен ли текущий бэкенд matplotlib: с файловыми бэкендами (Agg, PDF,
+# SVG и т.п.) показ графика на экране ничего не дает
+_INTERACTIVE = not matplotlib.get_backend().lower().startswith(
+    ('agg', 'pdf', 'svg', 'ps', 'pgf', 'cairo', 'template'))
+
+
+# Фигуры, переиспользуемые между вызовами, по размеру
+_FIG_CACHE = {}
+
+
+def _get_figure(figsize) -> plt.Figure:
+    """
+    Возвращает очищенную закэшированную фигуру заданного размера или создает новую.
+    
+    Повторное использование фигуры избавляет от создания холста бэкенда
+    и регистрации фигуры в pyplot при каждом построении. Фигура
+    пересоздается, если её окно было закрыто.
+    """
+    fig = _FIG_CACHE.get(figsize)
+    if fig is None or not plt.fignum_exists(fig.number):
+        fig = plt.figure(figsize=figsize)
+        _FIG_CACHE[figsize] = fig
+    else:
+        fig.clear()
+    return fig
+
+
+def _as_array(table) -> np.ndarray:
+    """
+    Таблица ДП в виде массива NumPy.
+    
+    Массив NumPy возвращается без копирования, поэтому вызывающему коду
+    выгоднее передавать таблицы сразу в этом виде. Список списков
+    преобразуется в массив NumPy и сужается до int32, только если все
+    значения помещаются в этот тип (проверка диапазона не зависит от версии
+    NumPy: до 2.0 прямое приведение к int32 молча переполнялось).
+    """
+    if isinstance(table, np.ndarray):
+        return table
+    data = np.asarray(table)
+    if data.dtype.kind in 'iu' and data.size:
+        info = np.iinfo(np.int32)
+        if info.min <= data.min() and data.max() <= info.max:
+            return data.astype(np.int32)
+    return data
+
+
+def _downsample(data: np.ndarray, row_labels: List[str], col_labels: List[str]):
+    """
+    Прореживание таблицы и её меток до HEATMAP_MAX_CELLS строк и столбцов.
+    
+    Срез с шагом не копирует данные, а imshow получает меньший буфер RGBA.
+    
+    Returns:
+        Кортеж (data, row_labels, col_labels) после прореживания
+    """
+    sr = max(1, -(-data.shape[0] // HEATMAP_MAX_CELLS))
+    sc = max(1, -(-data.shape[1] // HEATMAP_MAX_CELLS))
+    if sr > 1 or sc > 1:
+        data = data[::sr, ::sc]
+        row_labels = row_labels[::sr]
+        col_labels = col_labels[::sc]
+    return data, row_labels, col_labels
+
+
+@lru_cache(maxsize=8)
+def _knapsack_row_labels(n: int) -> Tuple[str, ...]:
+    """
+    Метки строк таблицы рюкзака для n предметов.
+    
+    Подписи собираются одной векторной операцией NumPy и кэшируются:
+    последовательные графики с тем же числом предметов получают готовый
+    неизменяемый кортеж.
+    """
+    items = np.char.add('Предмет ', np.arange(1, n + 1).astype(str))
+    return ('0',) + tuple(items.tolist())
+
+
+@njit(cache=True)
+def _ann_coords(h, w):
+    """
+    Координаты центров ячеек таблицы h x w в порядке обхода по строкам.
+    
+    Returns:
+        Кортеж массивов (xs, ys) длины h * w
+    """
+    xs = np.empty(h * w, np.int32)
+    ys = np.empty(h * w, np.int32)
+    k = 0
+    for i in range(h):
+        for j in range(w):
+            xs[k] = j
+            ys[k] = i
+            k += 1
+    return xs, ys
+
+
+def _annotate_cells(ax, data: np.ndarray, colors: Optional[np.ndarray] = None, **text_kwargs):
+    """
+    Вывод значений таблицы в её ячейки.
+    
+    Координаты, подписи и цвета готовятся заранее плоскими массивами
+    (координаты - скомпилированной numba функцией _ann_coords, подписи -
+    векторной операцией NumPy), и в Python остается только цикл вызовов ax.text.
+    
+    Args:
+        ax: оси графика
+        data: таблица значений
+        colors: цвета подписей той же формы, что и data (опционально)
+        **text_kwargs: общие параметры ax.text
+    """
+    xs, ys = _ann_coords(data.shape[0], data.shape[1])
+    labels = np.char.mod('%d', data).ravel().tolist()
+    if colors is None:
+        for x, y, label in zip(xs.tolist(), ys.tolist(), labels):
+            ax.text(x, y, label, **text_kwargs)
+    else:
+        for x, y, label, color in zip(xs.tolist(), ys.tolist(), labels, colors.ravel().tolist()):
+            ax.text(x, y, label, color=color, **text_kwargs)
+
+
+def _draw_heatmap(ax, data: np.ndarray, cmap_name: str) -> ScalarMappable:
+    """
+    Отрисовка тепловой карты таблицы ДП.
+    
+    Нормализация и перевод в цвета выполняются один раз заранее,
+    и imshow получает готовое изображение RGBA в uint8, минуя собственные
+    Normalize и палитру при каждой отрисовке.
+    
+    Returns:
+        Объект с той же нормализацией и палитрой для построения цветовой шкалы
+    """
+    cmap = _CMAPS[cmap_name]
+    vmin = data.min()
+    norm = Normalize(vmin=vmin, vmax=max(data.max(), vmin + 1))
+    # Таблица ДП - дискретная сетка: сглаживающая передискретизация не нужна
+    ax.imshow(cmap(norm(data), bytes=True), aspect='auto',
+              interpolation='nearest', interpolation_stage='rgba')
+    return ScalarMappable(norm=norm, cmap=cmap)
+
+
+def _content_key(data: np.ndarray, *params) -> str:
+    """
+    Хэш содержимого таблицы и параметров построения графика.
+    
+    В ключ входят тип, форма и байты массива, а также repr остальных
+    параметров (подписей, заголовка и т.п.), влияющих на изображение.
+    """
+    h = hashlib.blake2b(digest_size=16)
+    h.update(f"{data.dtype.str}{data.shape}".encode())
+    h.update(np.ascontiguousarray(data).tobytes())
+    for param in params:
+        h.update(repr(param).encode())
+    return h.hexdigest()
+
+
+def _is_cached(save_path: Optional[str], key: str) -> bool:
+    """
+    Проверка, что по пути save_path уже сохранен график с тем же ключом.
+    
+    Ключ хранится в файле-спутнике save_path + '.hash' рядом с изображением.
+    """
+    if not save_path or not os.path.exists(save_path):
+        return False
+    try:
+        with open(save_path + '.hash', encoding='ascii') as f:
+            return f.read() == key
+    except OSError:
+        return False
+
+
+def _save_cached(fig, save_path: str, key: Optional[str], dpi: int):
+    """
+    Сохранение фигуры и, если задан ключ, файла-спутника с ним.
+    
+    Без ключа устаревший файл-спутник удаляется, чтобы он не указывал
+    на перезаписанное изображение.
+    """
+    fig.savefig(save_path, dpi=dpi)
+    if key is not None:
+        with open(save_path + '.hash', 'w', encoding='ascii') as f:
+            f.write(key)
+    elif os.path.exists(save_path + '.hash'):
+        os.remove(save_path + '.hash')
+
+
+def _show(fig, show: Optional[bool]):
+    """Показ фигуры на экране; по умолчанию - только с интерактивным бэкендом."""
+    if show is None:
+        show = _INTERACTIVE
+    if show:
+        fig.canvas.draw_idle()
+        plt.show()
+
+
+def _add_colorbar(ax, mappable: ScalarMappable):
+    """
+    Цветовая шкала в заранее выделенной справа от ax оси.
+    
+    Явная ось cax избавляет colorbar от сжатия ax и повторного
+    расчета компоновки, которые выполняются при передаче ax=ax.
+    """
+    cax = make_axes_locatable(ax).append_axes("right", size="3%", pad=0.05)
+    ax.figure.colorbar(mappable, cax=cax)
+
 
 def visualize_dp_table(
-    table: List[List[int]],
+    table: Union[List[List[int]], np.ndarray],
     row_labels: List[str],
     col_labels: List[str],
     title: str,
-    save_path: str = None
+    save_path: str = None,
+    annotate: Optional[bool] = None,
+    cache: bool = False,
+    show: Optional[bool] = None,
+    dpi: int = DEFAULT_DPI
 ):
     """
     Визуализация таблицы динамического программирования.
     
     Args:
-        table: 2D таблица значений
+        table: 2D таблица значений (список списков или, без копирования, массив NumPy)
         row_labels: метки строк
         col_labels: метки столбцов
         title: заголовок графика
         save_path: путь для сохранения (опционально)
+        annotate: выводить ли значения в ячейках; по умолчанию - если
+            в таблице не больше ANNOTATION_MAX_CELLS ячеек
+        cache: не перестраивать график, если по пути save_path уже сохранен
+            график для тех же данных (сверяется хэш из файла save_path + '.hash');
+            в этом случае функция сразу завершается и график не показывается
+        show: показать ли график на экране; по умолчанию - если бэкенд
+            matplotlib интерактивный
+        dpi: разрешение сохраняемого изображения
     """
-    fig, ax = plt.subplots(figsize=(12, 8))
-    
     # Преобразуем в numpy массив для удобства
-    data = np.array(table)
+    data = _as_array(table)
+    
+    key = _content_key(data, row_labels, col_labels, title, annotate, dpi) if cache else None
+    if key is not None and _is_cached(save_path, key):
+        return
+    
+    fig = _get_figure((12, 8))
+    ax = fig.subplots()
     
     # Создаем тепловую карту
-    im = ax.imshow(data, cmap='YlOrRd', aspect='auto')
+    data, row_labels, col_labels = _downsample(data, row_labels, col_labels)
+    im = _draw_heatmap(ax, data, 'YlOrRd')
     
     # Добавляем значения в ячейки
-    for i in range(len(row_labels)):
-        for j in range(len(col_labels)):
-            text = ax.text(j, i, str(data[i, j]),
-                          ha="center", va="center", color="black", fontsize=8)
+    if annotate is None:
+        annotate = data.size <= ANNOTATION_MAX_CELLS
+    if annotate:
+        _annotate_cells(ax, data, ha="center", va="center", color="black", fontsize=8)
     
     # Устанавливаем метки
-    ax.set_xticks(np.arange(len(col_labels)))
-    ax.set_yticks(np.arange(len(row_labels)))
-    ax.set_xticklabels(col_labels)
-    ax.set_yticklabels(row_labels)
-    
-    # Поворачиваем метки оси X
-    plt.setp(ax.get_xticklabels(), rotation=45, ha="right", rotation_mode="anchor")
+    # Метки задаются вместе с делениями; поворот меток оси X передается
+    # при их создании, без отдельного прохода по готовым меткам
+    ax.set_xticks(np.arange(len(col_labels)), labels=col_labels,
+                  rotation=45, ha="right", rotation_mode="anchor")
+    ax.set_yticks(np.arange(len(row_labels)), labels=row_labels)
     
     ax.set_title(title, fontsize=14, fontweight='bold', pad=20)
     ax.set_xlabel('Столбцы', fontsize=12)
     ax.set_ylabel('Строки', fontsize=12)
     
     # Добавляем цветовую шкалу
-    plt.colorbar(im, ax=ax)
+    _add_colorbar(ax, im)
     
-    plt.tight_layout()
+    fig.tight_layout()
     
     if save_path:
-        plt.savefig(save_path, dpi=300, bbox_inches='tight')
+        _save_cached(fig, save_path, key, dpi)
     
-    plt.show()
-    plt.close()
+    _show(fig, show)
 
 
-def plot_fibonacci_comparison(results: Dict, save_path: str = None):
+def _draw_spec(ax, spec: Dict):
     """
-    Построение графика сравнения подходов для чисел Фибоначчи.
+    Отрисовка одного графика по его описанию.
     
     Args:
-        results: результаты сравнения из compare_fibonacci_approaches
-        save_path: путь для сохранения
+        ax: оси графика
+        spec: словарь с ключами 'kind' (имя метода осей: 'plot' или 'bar'),
+            'series' (список пар (args, kwargs) для вызова этого метода),
+            'xlabel', 'ylabel', 'title' и необязательными 'xticks'
+            (пара (позиции, подписи)) и 'grid_axis' (по умолчанию 'both')
     """
-    fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(14, 5))
-    
-    n_values = results['n_values']
-    
-    # График времени выполнения
-    ax1.plot(n_values, results['memoized_time'], 'o-', label='Нисходящий (мемоизация)', linewidth=2)
-    ax1.plot(n_values, results['bottom_up_time'], 's-', label='Восходящий', linewidth=2)
-    ax1.set_xlabel('n (номер числа Фибоначчи)', fontsize=11)
-    ax1.set_ylabel('Время выполнения (секунды)', fontsize=11)
-    ax1.set_title('Сравнение времени выполнения', fontsize=12, fontweight='bold')
-    ax1.legend()
-    ax1.grid(True, alpha=0.3)
+    draw = getattr(ax, spec['kind'])
+    for args, kwargs in spec['series']:
+        draw(*args, **kwargs)
+    ax.set_xlabel(spec['xlabel'], fontsize=11)
+    ax.set_ylabel(spec['ylabel'], fontsize=11)
+    ax.set_title(spec['title'], fontsize=12, fontweight='bold')
+    if 'xticks' in spec:
+        positions, labels = spec['xticks']
+        ax.set_xticks(positions, labels=labels)
+    if any('label' in kwargs for _, kwargs in spec['series']):
+        ax.legend()
+    ax.grid(True, alpha=0.3, axis=spec.get('grid_axis', 'both'))
+
+
+def _twin_plot(left: Dict, right: Dict, save_path: Optional[str],
+               show: Optional[bool], dpi: int):
+    """
+    Построение пары графиков рядом на общей фигуре 14x5.
     
-    # График потребления памяти
-    ax2.plot(n_values, [m / 1024 for m in results['memoized_memory']], 
-             'o-', label='Нисходящий (мемоизация)', linewidth=2)
-    ax2.plot(n_values, [m / 1024 for m in results['bottom_up_memory']], 
-             's-', label='Восходящий', linewidth=2)
-    ax2.set_xlabel('n (номер числа Фибоначчи)', fontsize=11)
-    ax2.set_ylabel('Память (КБ)', fontsize=11)
-    ax2.set_title('Сравнение потребления памяти', fontsize=12, fontweight='bold')
-    ax2.legend()
-    ax2.grid(True, alpha=0.3)
+    Общая для графиков сравнения часть: получение фигуры из кэша, один
+    расчет компоновки, сохранение и показ. Описания графиков - как в _draw_spec.
+    """
+    fig = _get_figure((14, 5))
+    ax1, ax2 = fig.subplots(1, 2)
+    _draw_spec(ax1, left)
+    _draw_spec(ax2, right)
     
-    plt.tight_layout()
+    fig.tight_layout()
     
     if save_path:
-        plt.savefig(save_path, dpi=300, bbox_inches='tight')
+        fig.savefig(save_path, dpi=dpi)
     
-    plt.show()
-    plt.close()
+    _show(fig, show)
 
 
-def plot_knapsack_comparison(results: Dict, save_path: str = None):
+def plot_fibonacci_comparison(results: Dict, save_path: str = None, show: Optional[bool] = None,
+                              dpi: int = DEFAULT_DPI):
+    """
+    Построение графика сравнения подходов для чисел Фибоначчи.
+    
+    Args:
+        results: результаты сравнения из compare_fibonacci_approaches
+        save_path: путь для сохранения
+        show: показать ли график на экране; по умолчанию - если бэкенд
+            matplotlib интерактивный
+        dpi: разрешение сохраняемого изображения
+    """
+    n_values = np.asarray(results['n_values'])
+    memo = dict(label='Нисходящий (мемоизация)', linewidth=2)
+    bottom_up = dict(label='Восходящий', linewidth=2)
+    
+    # Время выполнения и потребление памяти (в КБ)
+    _twin_plot(
+        dict(kind='plot',
+             series=[((n_values, results['memoized_time'], 'o-'), memo),
+                     ((n_values, results['bottom_up_time'], 's-'), bottom_up)],
+             xlabel='n (номер числа Фибоначчи)',
+             ylabel='Время выполнения (секунды)',
+             title='Сравнение времени выполнения'),
+        dict(kind='plot',
+             series=[((n_values, np.asarray(results['memoized_memory']) * (1.0 / 1024), 'o-'), memo),
+                     ((n_values, np.asarray(results['bottom_up_memory']) * (1.0 / 1024), 's-'), bottom_up)],
+             xlabel='n (номер числа Фибоначчи)',
+             ylabel='Память (КБ)',
+             title='Сравнение потребления памяти'),
+        save_path, show, dpi)
+
+
+def plot_knapsack_comparison(results: Dict, save_path: str = None, show: Optional[bool] = None,
+                             dpi: int = DEFAULT_DPI):
     """
     Построение графика сравнения ДП и жадного алгоритма для рюкзака.
     
     Args:
         results: результаты сравнения из compare_knapsack_approaches
         save_path: путь для сохранения
+        show: показать ли график на экране; по умолчанию - если бэкенд
+            matplotlib интерактивный
+        dpi: разрешение сохраняемого изображения
     """
-    fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(14, 5))
-    
     test_nums = results['test_num']
-    
-    # График стоимости
     x = np.arange(len(test_nums))
     width = 0.35
-    
-    ax1.bar(x - width/2, results['dp_value'], width, label='ДП (0-1 рюкзак)', alpha=0.8)
-    ax1.bar(x + width/2, results['greedy_value'], width, label='Жадный (непрерывный)', alpha=0.8)
-    ax1.set_xlabel('Номер теста', fontsize=11)
-    ax1.set_ylabel('Максимальная стоимость', fontsize=11)
-    ax1.set_title('Сравнение результатов', fontsize=12, fontweight='bold')
-    ax1.set_xticks(x)
-    ax1.set_xticklabels(test_nums)
-    ax1.legend()
-    ax1.grid(True, alpha=0.3, axis='y')
-    
-    # График времени выполнения
-    ax2.bar(x - width/2, results['dp_time'], width, label='ДП (0-1 рюкзак)', alpha=0.8)
-    ax2.bar(x + width/2, results['greedy_time'], width, label='Жадный (непрерывный)', alpha=0.8)
-    ax2.set_xlabel('Номер теста', fontsize=11)
-    ax2.set_ylabel('Время выполнения (секунды)', fontsize=11)
-    ax2.set_title('Сравнение времени выполнения', fontsize=12, fontweight='bold')
-    ax2.set_xticks(x)
-    ax2.set_xticklabels(test_nums)
-    ax2.legend()
-    ax2.grid(True, alpha=0.3, axis='y')
-    
-    plt.tight_layout()
-    
-    if save_path:
-        plt.savefig(save_path, dpi=300, bbox_inches='tight')
-    
-    plt.show()
-    plt.close()
+    dp = dict(label='ДП (0-1 рюкзак)', alpha=0.8)
+    greedy = dict(label='Жадный (непрерывный)', alpha=0.8)
+    
+    def bars(dp_key, greedy_key, ylabel, title):
+        return dict(kind='bar',
+                    series=[((x - width/2, results[dp_key], width), dp),
+                            ((x + width/2, results[greedy_key], width), greedy)],
+                    xlabel='Номер теста', ylabel=ylabel, title=title,
+                    xticks=(x, test_nums), grid_axis='y')
+    
+    # Стоимость и время выполнения
+    _twin_plot(
+        bars('dp_value', 'greedy_value', 'Максимальная стоимость', 'Сравнение результатов'),
+        bars('dp_time', 'greedy_time', 'Время выполнения (секунды)', 'Сравнение времени выполнения'),
+        save_path, show, dpi)
 
 
-def plot_scalability_analysis(results: Dict, save_path: str = None):
+def plot_scalability_analysis(results: Dict, save_path: str = None, show: Optional[bool] = None,
+                              dpi: int = DEFAULT_DPI):
     """
     Построение графика масштабируемости алгоритма рюкзака.
     
     Args:
         results: результаты из analyze_knapsack_scalability
         save_path: путь для сохранения
+        show: показать ли график на экране; по умолчанию - если бэкенд
+            matplotlib интерактивный
+        dpi: разрешение сохраняемого изображения
     """
-    fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(14, 5))
-    
-    num_items = results['num_items']
-    
-    # График времени выполнения
-    ax1.plot(num_items, results['execution_time'], 'o-', linewidth=2, markersize=6)
-    ax1.set_xlabel('Количество предметов', fontsize=11)
-    ax1.set_ylabel('Время выполнения (секунды)', fontsize=11)
-    ax1.set_title('Масштабируемость по времени', fontsize=12, fontweight='bold')
-    ax1.grid(True, alpha=0.3)
-    
-    # График потребления памяти
-    ax2.plot(num_items, [m / 1024 / 1024 for m in results['memory_used']], 
-             's-', linewidth=2, markersize=6, color='orange')
-    ax2.set_xlabel('Количество предметов', fontsize=11)
-    ax2.set_ylabel('Память (МБ)', fontsize=11)
-    ax2.set_title('Масштабируемость по памяти', fontsize=12, fontweight='bold')
-    ax2.grid(True, alpha=0.3)
-    
-    plt.tight_layout()
-    
-    if save_path:
-        plt.savefig(save_path, dpi=300, bbox_inches='tight')
-    
-    plt.show()
-    plt.close()
+    num_items = np.asarray(results['num_items'])
+    
+    # Время выполнения и потребление памяти (в МБ)
+    _twin_plot(
+        dict(kind='plot',
+             series=[((num_items, results['execution_time'], 'o-'),
+                      dict(linewidth=2, markersize=6))],
+             xlabel='Количество предметов',
+             ylabel='Время выполнения (секунды)',
+             title='Масштабируемость по времени'),
+        dict(kind='plot',
+             series=[((num_items, np.asarray(results['memory_used']) * (1.0 / 1024 / 1024), 's-'),
+                      dict(linewidth=2, markersize=6, color='orange'))],
+             xlabel='Количество предметов',
+             ylabel='Память (МБ)',
+             title='Масштабируемость по памяти'),
+        save_path, show, dpi)
 
 
 def visualize_knapsack_table(
     weights: List[int],
     values: List[int],
     capacity: int,
-    table: List[List[int]],
-    save_path: str = None
+    table: Union[List[List[int]], np.ndarray],
+    save_path: str = None,
+    annotate: Optional[bool] = None,
+    cache: bool = False,
+    show: Optional[bool] = None,
+    dpi: int = DEFAULT_DPI
 ):
     """
     Визуализация таблицы ДП для задачи о рюкзаке.
@@ -201,37 +488,48 @@ def visualize_knapsack_table(
         weights: веса предметов
         values: стоимости предметов
         capacity: вместимость рюкзака
-        table: таблица ДП
+        table: таблица ДП (список списков или, без копирования, массив NumPy)
         save_path: путь для сохранения
+        annotate: выводить ли значения в ячейках; по умолчанию - если
+            в отображаемой таблице не больше ANNOTATION_MAX_CELLS ячеек
+        cache: не перестраивать график, если по пути save_path уже сохранен
+            график для тех же данных (сверяется хэш из файла save_path + '.hash');
+            в этом случае функция сразу завершается и график не показывается
+        show: показать ли график на экране; по умолчанию - если бэкенд
+            matplotlib интерактивный
+        dpi: разрешение сохраняемого изображения
     """
-    fig, ax = plt.subplots(figsize=(14, 8))
+    data = _as_array(table)
+    
+    key = _content_key(data, weights, values, capacity, annotate, dpi) if cache else None
+    if key is not None and _is_cached(save_path, key):
+        return
     
-    data = np.array(table)
+    fig = _get_figure((14, 8))
+    ax = fig.subplots()
     
     # Создаем метки
-    row_labels = ['0'] + [f'Предмет {i}' for i in range(1, len(weights) + 1)]
-    col_labels = [str(w) for w in range(capacity + 1)]
+    row_labels = _knapsack_row_labels(len(weights))
     
-    # Ограничиваем количество столбцов для читаемости
-    if capacity > 20:
-        step = max(1, capacity // 20)
+    # Ограничиваем количество столбцов для читаемости; подписи строятся
+    # одной векторной операцией NumPy только для оставшихся столбцов
+    step = max(1, -(-data.shape[1] // KNAPSACK_MAX_COLUMNS))
+    if step > 1:
         data = data[:, ::step]
-        col_labels = col_labels[::step]
+    col_labels = np.arange(0, capacity + 1, step).astype(str).tolist()
+    data, row_labels, col_labels = _downsample(data, row_labels, col_labels)
     
-    im = ax.imshow(data, cmap='YlOrRd', aspect='auto')
+    im = _draw_heatmap(ax, data, 'YlOrRd')
     
     # Добавляем значения
-    for i in range(data.shape[0]):
-        for j in range(data.shape[1]):
-            text = ax.text(j, i, str(data[i, j]),
-                          ha="center", va="center", color="black", fontsize=7)
+    if annotate is None:
+        annotate = data.size <= ANNOTATION_MAX_CELLS
+    if annotate:
+        _annotate_cells(ax, data, ha="center", va="center", color="black", fontsize=7)
     
-    ax.set_xticks(np.arange(len(col_labels)))
-    ax.set_yticks(np.arange(len(row_labels)))
-    ax.set_xticklabels(col_labels)
-    ax.set_yticklabels(row_labels)
-    
-    plt.setp(ax.get_xticklabels(), rotation=45, ha="right", rotation_mode="anchor")
+    ax.set_xticks(np.arange(len(col_labels)), labels=col_labels,
+                  rotation=45, ha="right", rotation_mode="anchor")
+    ax.set_yticks(np.arange(len(row_labels)), labels=row_labels)
     
     ax.set_title(f'Таблица ДП для задачи о рюкзаке\n'
                  f'Предметы: {len(weights)}, Вместимость: {capacity}', 
@@ -239,104 +537,146 @@ def visualize_knapsack_table(
     ax.set_xlabel('Вместимость', fontsize=11)
     ax.set_ylabel('Предметы', fontsize=11)
     
-    plt.colorbar(im, ax=ax)
-    plt.tight_layout()
+    _add_colorbar(ax, im)
+    # Компоновка рассчитывается один раз здесь; savefig не обрезает
+    # рисунок повторно (bbox_inches='tight' потребовал бы лишней отрисовки),
+    # поэтому для широкой таблицы оставляется небольшой отступ
+    fig.tight_layout(pad=0.3)
     
     if save_path:
-        plt.savefig(save_path, dpi=300, bbox_inches='tight')
+        _save_cached(fig, save_path, key, dpi)
     
-    plt.show()
-    plt.close()
+    _show(fig, show)
 
 
-def visualize_lcs_table(s1: str, s2: str, table: List[List[int]], save_path: str = None):
+def visualize_lcs_table(
+    s1: str,
+    s2: str,
+    table: Union[List[List[int]], np.ndarray],
+    save_path: str = None,
+    annotate: Optional[bool] = None,
+    cache: bool = False,
+    show: Optional[bool] = None,
+    dpi: int = DEFAULT_DPI
+):
     """
     Визуализация таблицы ДП для LCS.
     
     Args:
         s1, s2: входные строки
-        table: таблица ДП
+        table: таблица ДП (список списков или, без копирования, массив NumPy)
         save_path: путь для сохранения
+        annotate: выводить ли значения в ячейках; по умолчанию - если
+            в таблице не больше ANNOTATION_MAX_CELLS ячеек
+        cache: не перестраивать график, если по пути save_path уже сохранен
+            график для тех же данных (сверяется хэш из файла save_path + '.hash');
+            в этом случае функция сразу завершается и график не показывается
+        show: показать ли график на экране; по умолчанию - если бэкенд
+            matplotlib интерактивный
+        dpi: разрешение сохраняемого изображения
     """
-    fig, ax = plt.subplots(figsize=(10, 8))
+    data = _as_array(table)
     
-    data = np.array(table)
+    key = _content_key(data, s1, s2, annotate, dpi) if cache else None
+    if key is not None and _is_cached(save_path, key):
+        return
+    
+    fig = _get_figure((10, 8))
+    ax = fig.subplots()
     
     # Создаем метки
     row_labels = [''] + list(s1)
     col_labels = [''] + list(s2)
+    data, row_labels, col_labels = _downsample(data, row_labels, col_labels)
     
-    im = ax.imshow(data, cmap='Blues', aspect='auto')
+    im = _draw_heatmap(ax, data, 'Blues')
     
-    # Добавляем значения
-    for i in range(data.shape[0]):
-        for j in range(data.shape[1]):
-            text = ax.text(j, i, str(data[i, j]),
-                          ha="center", va="center", color="white" if data[i, j] > data.max() / 2 else "black",
-                          fontsize=10, fontweight='bold')
+    # Добавляем значения; светлый текст - на ячейках темнее середины шкалы
+    if annotate is None:
+        annotate = data.size <= ANNOTATION_MAX_CELLS
+    if annotate:
+        colors = np.where(data > data.max() / 2, 'white', 'black')
+        _annotate_cells(ax, data, colors, ha="center", va="center", fontproperties=_FP_BOLD)
     
-    ax.set_xticks(np.arange(len(col_labels)))
-    ax.set_yticks(np.arange(len(row_labels)))
-    ax.set_xticklabels(col_labels)
-    ax.set_yticklabels(row_labels)
+    ax.set_xticks(np.arange(len(col_labels)), labels=col_labels)
+    ax.set_yticks(np.arange(len(row_labels)), labels=row_labels)
     
     ax.set_title(f'Таблица ДП для LCS\nСтрока 1: "{s1}", Строка 2: "{s2}"',
                  fontsize=12, fontweight='bold', pad=20)
     ax.set_xlabel('Строка 2', fontsize=11)
     ax.set_ylabel('Строка 1', fontsize=11)
     
-    plt.colorbar(im, ax=ax)
-    plt.tight_layout()
+    _add_colorbar(ax, im)
+    fig.tight_layout()
     
     if save_path:
-        plt.savefig(save_path, dpi=300, bbox_inches='tight')
+        _save_cached(fig, save_path, key, dpi)
     
-    plt.show()
-    plt.close()
+    _show(fig, show)
 
 
-def visualize_levenshtein_table(s1: str, s2: str, table: List[List[int]], save_path: str = None):
+def visualize_levenshtein_table(
+    s1: str,
+    s2: str,
+    table: Union[List[List[int]], np.ndarray],
+    save_path: str = None,
+    annotate: Optional[bool] = None,
+    cache: bool = False,
+    show: Optional[bool] = None,
+    dpi: int = DEFAULT_DPI
+):
     """
     Визуализация таблицы ДП для расстояния Левенштейна.
     
     Args:
         s1, s2: входные строки
-        table: таблица ДП
+        table: таблица ДП (список списков или, без копирования, массив NumPy)
         save_path: путь для сохранения
+        annotate: выводить ли значения в ячейках; по умолчанию - если
+            в таблице не больше ANNOTATION_MAX_CELLS ячеек
+        cache: не перестраивать график, если по пути save_path уже сохранен
+            график для тех же данных (сверяется хэш из файла save_path + '.hash');
+            в этом случае функция сразу завершается и график не показывается
+        show: показать ли график на экране; по умолчанию - если бэкенд
+            matplotlib интерактивный
+        dpi: разрешение сохраняемого изображения
     """
-    fig, ax = plt.subplots(figsize=(10, 8))
+    data = _as_array(table)
+    
+    key = _content_key(data, s1, s2, annotate, dpi) if cache else None
+    if key is not None and _is_cached(save_path, key):
+        return
     
-    data = np.array(table)
+    fig = _get_figure((10, 8))
+    ax = fig.subplots()
     
     # Создаем метки
     row_labels = [''] + list(s1)
     col_labels = [''] + list(s2)
+    data, row_labels, col_labels = _downsample(data, row_labels, col_labels)
     
-    im = ax.imshow(data, cmap='Reds', aspect='auto')
+    im = _draw_heatmap(ax, data, 'Reds')
     
-    # Добавляем значения
-    for i in range(data.shape[0]):
-        for j in range(data.shape[1]):
-            text = ax.text(j, i, str(data[i, j]),
-                          ha="center", va="center", color="white" if data[i, j] > data.max() / 2 else "black",
-                          fontsize=10, fontweight='bold')
+    # Добавляем значения; светлый текст - на ячейках темнее середины шкалы
+    if annotate is None:
+        annotate = data.size <= ANNOTATION_MAX_CELLS
+    if annotate:
+        colors = np.where(data > data.max() / 2, 'white', 'black')
+        _annotate_cells(ax, data, colors, ha="center", va="center", fontproperties=_FP_BOLD)
     
-    ax.set_xticks(np.arange(len(col_labels)))
-    ax.set_yticks(np.arange(len(row_labels)))
-    ax.set_xticklabels(col_labels)
-    ax.set_yticklabels(row_labels)
+    ax.set_xticks(np.arange(len(col_labels)), labels=col_labels)
+    ax.set_yticks(np.arange(len(row_labels)), labels=row_labels)
     
     ax.set_title(f'Таблица ДП для расстояния Левенштейна\nСтрока 1: "{s1}", Строка 2: "{s2}"',
                  fontsize=12, fontweight='bold', pad=20)
     ax.set_xlabel('Строка 2', fontsize=11)
     ax.set_ylabel('Строка 1', fontsize=11)
     
-    plt.colorbar(im, ax=ax)
-    plt.tight_layout()
+    _add_colorbar(ax, im)
+    fig.tight_layout()
     
     if save_path:
-        plt.savefig(save_path, dpi=300, bbox_inches='tight')
+        _save_cached(fig, save_path, key, dpi)
     
-    plt.show()
-    plt.close()
+    _show(fig, show)
 